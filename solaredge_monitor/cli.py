@@ -1,7 +1,116 @@
 # solaredge_monitor/cli.py
-import argparse
+from collections.abc import Sequence
+from functools import cache
+from types import SimpleNamespace
+
+DEFAULT_CONFIG_PATH = "solaredge_monitor.conf"
+
+_NOTIFY_MODES = ("healthy", "fault", "both")
+_FAST_FLAGS = {"--debug": "debug", "--quiet": "quiet", "--json": "json"}
+
+
+def _add_simulate_args(cmd_sim):
+    cmd_sim.add_argument(
+        "--scenario",
+        help="Override [simulation] scenario name",
+    )
+
+
+def _add_notify_args(cmd_notify):
+    cmd_notify.add_argument(
+        "--mode",
+        choices=_NOTIFY_MODES,
+        default="both",
+        help="Which scenario(s) to simulate when sending notifications",
+    )
+
+
+def _add_maintain_args(cmd_maint):
+    cmd_maint.add_argument(
+        "--snapshot-days",
+        type=int,
+        help="Override retention days for inverter_snapshots",
+    )
+    cmd_maint.add_argument(
+        "--summary-days",
+        type=int,
+        help="Override retention days for site summaries",
+    )
+    cmd_maint.add_argument(
+        "--no-vacuum",
+        action="store_true",
+        help="Skip VACUUM after pruning",
+    )
+    cmd_maint.add_argument(
+        "--full-vacuum",
+        action="store_true",
+        help="Rewrite the whole database with VACUUM instead of an incremental vacuum",
+    )
+
+
+# Subcommand name -> (help text, argument builder or None)
+SUBCOMMANDS = {
+    # One-shot health check
+    "health": ("Run a one-shot health check", None),
+    # Simulation-driven health check
+    "simulate": ("Run a one-shot health check using simulated inputs", _add_simulate_args),
+    # Notification test helper
+    "notify-test": ("Send test notifications for healthy/fault scenarios", _add_notify_args),
+    "maintain-db": (
+        "Prune historical data from the state database based on retention settings",
+        _add_maintain_args,
+    ),
+}
+
+
+def _peek_command(argv: Sequence[str]) -> str | None:
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg == "--config":
+            skip_next = True
+            continue
+        if arg in SUBCOMMANDS:
+            return arg
+    return None
+
+
+def fast_health_args(argv: Sequence[str]) -> SimpleNamespace | None:
+    # Plain `[--config PATH] [--debug|--quiet|--json] health` runs (the cron case) are
+    # parsed by hand so argparse is never imported; anything else returns None.
+    if not argv or argv[-1] != "health":
+        return None
+    values = {"config": DEFAULT_CONFIG_PATH, "debug": False, "quiet": False, "json": False}
+    remaining = iter(argv[:-1])
+    for arg in remaining:
+        if arg in _FAST_FLAGS:
+            values[_FAST_FLAGS[arg]] = True
+        elif arg == "--config":
+            value = next(remaining, None)
+            if value is None or value.startswith("-"):
+                return None
+            values["config"] = value
+        elif arg.startswith("--config="):
+            values["config"] = arg.partition("=")[2]
+        else:
+            return None
+    return SimpleNamespace(command="health", **values)
+
+
+def build_parser(argv: Sequence[str] | None = None):
+    # When argv is known, only the selected subcommand gets its arguments attached; the
+    # rest are still registered by name so usage/help output is unchanged.
+    selected = _peek_command(argv) if argv is not None else None
+    return _build_parser(selected)
+
+
+@cache
+def _build_parser(selected: str | None):
+    # Parsers are only ever used for parse_args(), so one instance per selection is reused.
+    import argparse
 
-def build_parser():
     parser = argparse.ArgumentParser(
         prog="solaredge-monitor",
         description="SolarEdge System Health Monitor"
@@ -9,7 +118,7 @@ def build_parser():
 
     parser.add_argument(
         "--config",
-        default="solaredge_monitor.conf",
+        default=DEFAULT_CONFIG_PATH,
         help="Path to configuration file"
     )
 
@@ -33,49 +142,9 @@ def build_parser():
 
     sub = parser.add_subparsers(dest="command", required=True)
 
-    # One-shot health check
-    sub.add_parser("health", help="Run a one-shot health check")
-
-    # Simulation-driven health check
-    cmd_sim = sub.add_parser(
-        "simulate",
-        help="Run a one-shot health check using simulated inputs",
-    )
-    cmd_sim.add_argument(
-        "--scenario",
-        help="Override [simulation] scenario name",
-    )
-
-    # Notification test helper
-    cmd_notify = sub.add_parser(
-        "notify-test",
-        help="Send test notifications for healthy/fault scenarios",
-    )
-    cmd_notify.add_argument(
-        "--mode",
-        choices=("healthy", "fault", "both"),
-        default="both",
-        help="Which scenario(s) to simulate when sending notifications",
-    )
-
-    cmd_maint = sub.add_parser(
-        "maintain-db",
-        help="Prune historical data from the state database based on retention settings",
-    )
-    cmd_maint.add_argument(
-        "--snapshot-days",
-        type=int,
-        help="Override retention days for inverter_snapshots",
-    )
-    cmd_maint.add_argument(
-        "--summary-days",
-        type=int,
-        help="Override retention days for site summaries",
-    )
-    cmd_maint.add_argument(
-        "--no-vacuum",
-        action="store_true",
-        help="Skip VACUUM after pruning",
-    )
+    for name, (help_text, add_args) in SUBCOMMANDS.items():
+        cmd = sub.add_parser(name, help=help_text)
+        if add_args is not None and selected in (None, name):
+            add_args(cmd)
 
     return parser
@@ -1,7 +1,20 @@
 # solaredge_monitor/config.py
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable
 import configparser
+import os
+import pickle
+import re
+import sys
+
+
+# [simulation:NAME] scenario sections; captures NAME without surrounding whitespace.
+_SIM_SECTION_RE = re.compile(r"^simulation:\s*(\S(?:.*\S)?)\s*$")
+
+# Opt-in on-disk cache of the parsed AppConfig; set SOLAREDGE_CONFIG_CACHE=1 to enable.
+CONFIG_CACHE_ENV = "SOLAREDGE_CONFIG_CACHE"
 
 
 # Open-Meteo weather codes that imply precipitation (rain/snow/thunder)
@@ -15,7 +28,7 @@ DEFAULT_PRECIP_WEATHER_CODES: tuple[int, ...] = (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InverterConfig:
     name: str
     host: str
@@ -28,28 +41,40 @@ class InverterConfig:
     azimuth_deg: float | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModbusConfig:
-    inverters: list[InverterConfig]
+    inverters: tuple[InverterConfig, ...]
     retries: int = 3
     timeout: float = 3.0
     skip_modbus_at_night: bool = True
+    # Derived once from the inverters: name -> expected optimizer count.
+    expected_optimizer_counts: dict[str, int] = field(init=False, repr=False, compare=False)
+    has_optimizer_expectations: bool = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        counts = {
+            inv.name: inv.expected_optimizers
+            for inv in self.inverters
+            if inv.expected_optimizers is not None
+        }
+        object.__setattr__(self, "expected_optimizer_counts", counts)
+        object.__setattr__(self, "has_optimizer_expectations", bool(counts))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PushoverConfig:
     token: str | None = None
     user: str | None = None
     enabled: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthchecksConfig:
     ping_url: str | None = None
     enabled: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthConfig:
     peer_ratio_threshold: float = 0.20
     min_production_for_peer_check: float = 0.5   # percent of AC capacity
@@ -66,7 +91,7 @@ class HealthConfig:
     precip_cloud_cover_pct: float = 100.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DaylightConfig:
     timezone: str = "UTC"
     latitude: float | None = None
@@ -78,7 +103,7 @@ class DaylightConfig:
     static_sunset: str | None = "20:30"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SolarEdgeAPIConfig:
     enabled: bool = False
     api_key: str | None = None
@@ -86,14 +111,15 @@ class SolarEdgeAPIConfig:
     base_url: str = "https://monitoringapi.solaredge.com"
     timeout: float = 20.0
     skip_at_night: bool = False
+    cache_ttl_minutes: float = 0.0  # reuse stored inventory responses across runs (0 disables)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StateConfig:
     path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimulationConfig:
     scenario: str | None = None
     simulated_time: str | None = None
@@ -107,7 +133,7 @@ class SimulationConfig:
         return root
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetentionConfig:
     snapshot_days: int = 30
     summary_days: int = 90
@@ -115,9 +141,10 @@ class RetentionConfig:
     incident_event_days: int = 365
     health_counter_days: int = 30
     vacuum_after_prune: bool = True
+    vacuum_page_limit: int = 2000
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeatherConfig:
     enabled: bool = False
     provider: str = "open-meteo"
@@ -134,11 +161,11 @@ class WeatherConfig:
     log_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     console_level: str = "INFO"
     console_quiet: bool = False
-    debug_modules: list[str] = field(default_factory=list)
+    debug_modules: tuple[str, ...] = ()
     structured_enabled: bool = False
     structured_path: str | None = None
     log_path: str | None = None
@@ -146,7 +173,7 @@ class LoggingConfig:
     log_backup_count: int = 5
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     modbus: ModbusConfig
     pushover: PushoverConfig
@@ -161,217 +188,301 @@ class AppConfig:
     logging: LoggingConfig
 
 
+# Same spellings configparser.getboolean() accepts.
+_TRUE = frozenset({"1", "true", "yes", "on"})
+_FALSE = frozenset({"0", "false", "no", "off"})
+
+
+def _as_bool(value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in _TRUE:
+        return True
+    if normalized in _FALSE:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+def _maybe_float(raw: str) -> float | None:
+    raw = raw.strip()
+    return float(raw) if raw else None
+
+
+def _maybe_int(raw: str) -> int | None:
+    raw = raw.strip()
+    return int(raw) if raw else None
+
+
+def _split_csv(raw: str) -> list[str]:
+    return list(filter(None, map(str.strip, raw.split(","))))
+
+
+def _parse_str_tuple(raw: str) -> tuple[str, ...]:
+    return tuple(_split_csv(raw))
+
+
+def _parse_int_list(raw: str) -> tuple[int, ...]:
+    return tuple(map(int, _split_csv(raw)))
+
+
+def _parse_precip_codes(raw: str) -> tuple[int, ...]:
+    return _parse_int_list(raw) or DEFAULT_PRECIP_WEATHER_CODES
+
+
+# (dataclass field, config key or alias keys, coercer applied to the raw string)
+_FieldSpec = tuple[str, str | tuple[str, ...], Callable[[str], Any]]
+
+# Section name -> (dataclass, field specs). Keys absent from the file, and values a
+# coercer maps to None (blank optionals), are left to the dataclass defaults.
+_SECTION_SCHEMA: dict[str, tuple[type, tuple[_FieldSpec, ...]]] = {
+    "pushover": (PushoverConfig, (
+        ("token", "token", str),
+        ("user", "user", str),
+        ("enabled", "enabled", _as_bool),
+    )),
+    "healthchecks": (HealthchecksConfig, (
+        ("ping_url", "ping_url", str),
+        ("enabled", "enabled", _as_bool),
+    )),
+    "health": (HealthConfig, (
+        ("peer_ratio_threshold", "peer_ratio_threshold", float),
+        ("min_production_for_peer_check", "min_production_for_peer_check", float),
+        ("low_light_peer_skip_threshold", "low_light_peer_skip_threshold", float),
+        ("low_pac_threshold", "low_pac_threshold", float),
+        ("consecutive_health_alerts", "consecutive_health_alerts", int),
+        ("consecutive_recovery_samples", "consecutive_recovery_samples", int),
+        ("identical_alert_gate_minutes", "identical_alert_gate_minutes", int),
+        ("repeat_alert_interval_minutes", "repeat_alert_interval_minutes", int),
+        ("low_vdc_threshold", "low_vdc_threshold", float),
+        ("min_alert_sun_el_deg", "min_alert_sun_el_deg", _maybe_float),
+        ("alert_irradiance_floor_wm2", "alert_irradiance_floor_wm2", float),
+        ("precip_cloud_cover_pct", "precip_cloud_cover_pct", float),
+        ("precip_weather_codes", "precip_weather_codes", _parse_precip_codes),
+    )),
+    "daylight": (DaylightConfig, (
+        ("timezone", "timezone", str),
+        ("latitude", "latitude", _maybe_float),
+        ("longitude", "longitude", _maybe_float),
+        ("sunrise_grace_minutes", "sunrise_grace_minutes", int),
+        ("sunset_grace_minutes", "sunset_grace_minutes", int),
+        ("summary_delay_minutes", "summary_delay_minutes", int),
+        ("static_sunrise", "static_sunrise", str),
+        ("static_sunset", "static_sunset", str),
+    )),
+    "solaredge_api": (SolarEdgeAPIConfig, (
+        ("enabled", "enabled", _as_bool),
+        ("api_key", ("api_key", "solaredge_api_key"), str),
+        ("site_id", ("site_id", "solaredge_site_id"), str),
+        ("base_url", "base_url", str),
+        ("timeout", "timeout", float),
+        ("skip_at_night", "skip_se_api_at_night", _as_bool),
+        ("cache_ttl_minutes", "cache_ttl_minutes", _maybe_float),
+    )),
+    "state": (StateConfig, (
+        ("path", "path", str),
+    )),
+    "retention": (RetentionConfig, (
+        ("snapshot_days", "snapshot_days", _maybe_int),
+        ("summary_days", "summary_days", _maybe_int),
+        ("incident_days", "incident_days", _maybe_int),
+        ("incident_event_days", "incident_event_days", _maybe_int),
+        ("health_counter_days", "health_counter_days", _maybe_int),
+        ("vacuum_after_prune", "vacuum_after_prune", _as_bool),
+        ("vacuum_page_limit", "vacuum_page_limit", _maybe_int),
+    )),
+    "weather": (WeatherConfig, (
+        ("enabled", "enabled", _as_bool),
+        ("provider", "provider", str),
+        ("latitude", "latitude", _maybe_float),
+        ("longitude", "longitude", _maybe_float),
+        ("tilt_deg", "tilt_deg", float),
+        ("azimuth_deg", "azimuth_deg", float),
+        ("albedo", "albedo", float),
+        ("array_kw_dc", "array_kw_dc", _maybe_float),
+        ("ac_capacity_kw", "ac_capacity_kw", _maybe_float),
+        ("dc_ac_derate", "dc_ac_derate", float),
+        ("noct_c", "noct_c", float),
+        ("temp_coeff_per_c", "temp_coeff_per_c", float),
+        ("log_path", "log_path", str),
+    )),
+    "logging": (LoggingConfig, (
+        ("console_level", "console_level", str),
+        ("console_quiet", "console_quiet", _as_bool),
+        ("debug_modules", "debug_modules", _parse_str_tuple),
+        ("structured_enabled", "structured_enabled", _as_bool),
+        ("structured_path", "structured_path", str),
+        ("log_path", "log_path", str),
+        ("log_max_bytes", "log_max_bytes", int),
+        ("log_backup_count", "log_backup_count", int),
+    )),
+}
+
+
+_MODBUS_FIELDS: tuple[_FieldSpec, ...] = (
+    ("retries", "retries", int),
+    ("timeout", "timeout", float),
+    ("skip_modbus_at_night", "skip_modbus_at_night", _as_bool),
+)
+
+_INVERTER_FIELDS: tuple[_FieldSpec, ...] = (
+    ("host", "host", str),
+    ("port", "port", int),
+    ("unit", "unit", int),
+    ("expected_optimizers", "expected_optimizers", _maybe_int),
+    ("array_kw_dc", "array_kw_dc", _maybe_float),
+    ("ac_capacity_kw", "ac_capacity_kw", _maybe_float),
+    ("tilt_deg", "tilt_deg", _maybe_float),
+    ("azimuth_deg", "azimuth_deg", _maybe_float),
+)
+
+
+def _build_section(sections: dict[str, dict[str, str]], name: str) -> Any:
+    cls, fields = _SECTION_SCHEMA[name]
+    return cls(**_coerce_fields(sections.get(name, {}), fields))
+
+
+def _coerce_fields(sec: dict[str, str], fields: tuple[_FieldSpec, ...]) -> dict[str, Any]:
+    # Converters arrive as loop locals from the schema; bind the lookups once as well.
+    kwargs = {}
+    get = sec.get
+    for field_name, keys, coerce in fields:
+        if isinstance(keys, str):
+            raw = get(keys)
+        else:
+            # First non-empty alias wins.
+            raw = next(filter(None, map(get, keys)), None)
+        if raw is not None and (value := coerce(raw)) is not None:
+            kwargs[field_name] = value
+    return kwargs
+
+
+def _config_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+    return Path(base).expanduser() / "solaredge-monitor" / "config.pkl"
+
+
+def _build_sections(sections: dict[str, dict[str, str]]) -> dict[str, Any]:
+    # Schema section names double as the AppConfig field names.
+    return {name: _build_section(sections, name) for name in _SECTION_SCHEMA}
+
+
+@lru_cache(maxsize=8)
+def _load_memoized(path: str, mtime_ns: int, size: int) -> AppConfig:
+    if os.environ.get(CONFIG_CACHE_ENV) == "1":
+        return Config._load_cached(path, mtime_ns, size)
+    return Config._parse(path)
+
+
 class Config:
     def __init__(self, path: str):
-        self.path = Path(path)
-        self.parser = configparser.ConfigParser(inline_comment_prefixes=("#",))
-        read = self.parser.read(self.path)
-        if not read:
-            raise FileNotFoundError(f"Config file not found: {self.path}")
+        self.path = Path(path).expanduser()
+        self.parser = configparser.RawConfigParser(
+            inline_comment_prefixes=("#",),
+            interpolation=None,
+            empty_lines_in_values=False,
+        )
+        try:
+            fh = self.path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {self.path}") from None
+        with fh:
+            self.parser.read_file(fh, source=str(self.path))
+        # Materialise every section once; load() then works on plain dicts instead of
+        # going through SectionProxy/interpolation for each key lookup.
+        self.sections: dict[str, dict[str, str]] = {
+            name: dict(self.parser[name]) for name in self.parser.sections()
+        }
 
     @classmethod
     def load(cls, path: str) -> AppConfig:
+        cfg_path = Path(path).expanduser()
+        try:
+            st = cfg_path.stat()
+        except OSError:
+            return cls._parse(path)
+        # One AppConfig per (file, mtime, size) is shared by every caller. The dataclasses
+        # are frozen, but expected_optimizer_counts and the simulation settings/scenarios
+        # are plain dicts (MappingProxyType would break the pickle cache): treat the
+        # result as read-only and copy before mutating.
+        return _load_memoized(str(cfg_path.resolve()), st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _load_cached(cls, path: str, mtime_ns: int, size: int) -> AppConfig:
+        """Return a pickled AppConfig when the config file is unchanged since it was cached."""
+        # Include this module's mtime so a code upgrade never revives a stale layout.
+        key = (path, mtime_ns, size, Path(__file__).stat().st_mtime_ns)
+        cache_path = _config_cache_path()
+        try:
+            with cache_path.open("rb") as fh:
+                cached_key, cached_cfg = pickle.load(fh)
+            if cached_key == key:
+                return cached_cfg
+        except Exception:
+            pass
+
+        app_cfg = cls._parse(path)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with tmp_path.open("wb") as fh:
+                pickle.dump((key, app_cfg), fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+        return app_cfg
+
+    @classmethod
+    def _parse(cls, path: str) -> AppConfig:
         cfg = cls(path)
 
-        p = cfg.parser
-
-        def _as_bool(value: str) -> bool:
-            normalized = value.strip().lower()
-            if normalized == "true":
-                return True
-            if normalized == "false":
-                return False
-            raise ValueError(f"Invalid boolean value: {value!r}")
-
-        def _maybe_float(raw: str | None) -> float | None:
-            if raw is None:
-                return None
-            raw = raw.strip()
-            if not raw:
-                return None
-            return float(raw)
-
-        def _parse_int_list(raw: str | None) -> tuple[int, ...]:
-            if raw is None:
-                return tuple()
-            parts = [p.strip() for p in raw.split(",")]
-            ints = [int(p) for p in parts if p]
-            return tuple(ints)
+        p = cfg.sections
 
         # --- Modbus ---
-        inverters: list[InverterConfig] = []
         if "modbus" not in p:
             raise ValueError("[modbus] section missing from config")
 
-        modbus_sec = p["modbus"]
-        inv_names = modbus_sec.get("inverters", "")
-        for name in [x.strip() for x in inv_names.split(",") if x.strip()]:
+        def _inverter(name: str) -> InverterConfig:
             sec = f"inverter:{name}"
             if sec not in p:
                 raise ValueError(f"Missing section [{sec}] for inverter '{name}'")
-            inv_sec = p[sec]
-            inv_kwargs = {
-                "name": name,
-                "host": inv_sec["host"],
-            }
-            if "port" in inv_sec:
-                inv_kwargs["port"] = int(inv_sec["port"])
-            if "unit" in inv_sec:
-                inv_kwargs["unit"] = int(inv_sec["unit"])
-            if "expected_optimizers" in inv_sec:
-                inv_kwargs["expected_optimizers"] = int(inv_sec["expected_optimizers"])
-            if "array_kw_dc" in inv_sec:
-                inv_kwargs["array_kw_dc"] = float(inv_sec["array_kw_dc"])
-            if "ac_capacity_kw" in inv_sec:
-                inv_kwargs["ac_capacity_kw"] = float(inv_sec["ac_capacity_kw"])
-            if "tilt_deg" in inv_sec:
-                inv_kwargs["tilt_deg"] = float(inv_sec["tilt_deg"])
-            if "azimuth_deg" in inv_sec:
-                inv_kwargs["azimuth_deg"] = float(inv_sec["azimuth_deg"])
-            inverters.append(InverterConfig(**inv_kwargs))
-
-        modbus_kwargs = {}
-        if "retries" in modbus_sec:
-            modbus_kwargs["retries"] = int(modbus_sec["retries"])
-        if "timeout" in modbus_sec:
-            modbus_kwargs["timeout"] = float(modbus_sec["timeout"])
-        if "skip_modbus_at_night" in modbus_sec:
-            modbus_kwargs["skip_modbus_at_night"] = _as_bool(modbus_sec["skip_modbus_at_night"])
+            inv_kwargs = _coerce_fields(p[sec], _INVERTER_FIELDS)
+            if "host" not in inv_kwargs:
+                raise ValueError(f"Missing 'host' in section [{sec}]")
+            return InverterConfig(name=name, **inv_kwargs)
+
+        modbus_sec = p["modbus"]
+        inv_names = modbus_sec.get("inverters", "")
+        # Names are reused as dict keys throughout a run (snapshots, serial maps, state).
+        names = [sys.intern(s) for s in _split_csv(inv_names)]
+        inverters = tuple(_inverter(name) for name in names)
 
         modbus = ModbusConfig(
             inverters=inverters,
-            **modbus_kwargs,
+            **_coerce_fields(modbus_sec, _MODBUS_FIELDS),
         )
 
-        # --- Pushover ---
-        pushover_kwargs = {}
-        if "pushover" in p:
-            pushover_sec = p["pushover"]
-            if "token" in pushover_sec:
-                pushover_kwargs["token"] = pushover_sec["token"]
-            if "user" in pushover_sec:
-                pushover_kwargs["user"] = pushover_sec["user"]
-            if "enabled" in pushover_sec:
-                pushover_kwargs["enabled"] = _as_bool(pushover_sec["enabled"])
-        pushover = PushoverConfig(**pushover_kwargs)
-
-        # --- Healthchecks ---
-        healthchecks_kwargs = {}
-        if "healthchecks" in p:
-            hc_sec = p["healthchecks"]
-            if "ping_url" in hc_sec:
-                healthchecks_kwargs["ping_url"] = hc_sec["ping_url"]
-            if "enabled" in hc_sec:
-                healthchecks_kwargs["enabled"] = _as_bool(hc_sec["enabled"])
-        healthchecks = HealthchecksConfig(**healthchecks_kwargs)
-
-        # --- Health ---
-        health_kwargs = {}
-        if "health" in p:
-            health_sec = p["health"]
-            if "peer_ratio_threshold" in health_sec:
-                health_kwargs["peer_ratio_threshold"] = float(health_sec["peer_ratio_threshold"])
-            if "min_production_for_peer_check" in health_sec:
-                health_kwargs["min_production_for_peer_check"] = float(health_sec["min_production_for_peer_check"])
-            if "low_light_peer_skip_threshold" in health_sec:
-                health_kwargs["low_light_peer_skip_threshold"] = float(health_sec["low_light_peer_skip_threshold"])
-            if "low_pac_threshold" in health_sec:
-                health_kwargs["low_pac_threshold"] = float(health_sec["low_pac_threshold"])
-            if "consecutive_health_alerts" in health_sec:
-                health_kwargs["consecutive_health_alerts"] = int(health_sec["consecutive_health_alerts"])
-            if "consecutive_recovery_samples" in health_sec:
-                health_kwargs["consecutive_recovery_samples"] = int(health_sec["consecutive_recovery_samples"])
-            if "identical_alert_gate_minutes" in health_sec:
-                health_kwargs["identical_alert_gate_minutes"] = int(health_sec["identical_alert_gate_minutes"])
-            if "repeat_alert_interval_minutes" in health_sec:
-                health_kwargs["repeat_alert_interval_minutes"] = int(health_sec["repeat_alert_interval_minutes"])
-            if "low_vdc_threshold" in health_sec:
-                health_kwargs["low_vdc_threshold"] = float(health_sec["low_vdc_threshold"])
-            if "min_alert_sun_el_deg" in health_sec:
-                health_kwargs["min_alert_sun_el_deg"] = float(health_sec["min_alert_sun_el_deg"])
-            if "alert_irradiance_floor_wm2" in health_sec:
-                health_kwargs["alert_irradiance_floor_wm2"] = float(health_sec["alert_irradiance_floor_wm2"])
-            if "precip_cloud_cover_pct" in health_sec:
-                health_kwargs["precip_cloud_cover_pct"] = float(health_sec["precip_cloud_cover_pct"])
-            if "precip_weather_codes" in health_sec:
-                codes = _parse_int_list(health_sec["precip_weather_codes"])
-                health_kwargs["precip_weather_codes"] = codes or DEFAULT_PRECIP_WEATHER_CODES
-        health_cfg = HealthConfig(**health_kwargs)
-
-        # --- Daylight ---
-        daylight_kwargs = {}
-        if "daylight" in p:
-            daylight_sec = p["daylight"]
-            if "timezone" in daylight_sec:
-                daylight_kwargs["timezone"] = daylight_sec["timezone"]
-            if (latitude := _maybe_float(daylight_sec.get("latitude"))) is not None:
-                daylight_kwargs["latitude"] = latitude
-            if (longitude := _maybe_float(daylight_sec.get("longitude"))) is not None:
-                daylight_kwargs["longitude"] = longitude
-            if "sunrise_grace_minutes" in daylight_sec:
-                daylight_kwargs["sunrise_grace_minutes"] = int(daylight_sec["sunrise_grace_minutes"])
-            if "sunset_grace_minutes" in daylight_sec:
-                daylight_kwargs["sunset_grace_minutes"] = int(daylight_sec["sunset_grace_minutes"])
-            if "summary_delay_minutes" in daylight_sec:
-                daylight_kwargs["summary_delay_minutes"] = int(daylight_sec["summary_delay_minutes"])
-            if "static_sunrise" in daylight_sec:
-                daylight_kwargs["static_sunrise"] = daylight_sec["static_sunrise"]
-            if "static_sunset" in daylight_sec:
-                daylight_kwargs["static_sunset"] = daylight_sec["static_sunset"]
-        daylight_cfg = DaylightConfig(**daylight_kwargs)
-
-        # --- SolarEdge API ---
-        solaredge_api_kwargs = {}
-        if "solaredge_api" in p:
-            se_api_sec = p["solaredge_api"]
-            if "enabled" in se_api_sec:
-                solaredge_api_kwargs["enabled"] = _as_bool(se_api_sec["enabled"])
-            api_key = se_api_sec.get("api_key") or se_api_sec.get("solaredge_api_key")
-            if api_key is not None:
-                solaredge_api_kwargs["api_key"] = api_key
-            site_id = se_api_sec.get("site_id") or se_api_sec.get("solaredge_site_id")
-            if site_id is not None:
-                solaredge_api_kwargs["site_id"] = site_id
-            if "base_url" in se_api_sec:
-                solaredge_api_kwargs["base_url"] = se_api_sec["base_url"]
-            if "timeout" in se_api_sec:
-                solaredge_api_kwargs["timeout"] = float(se_api_sec["timeout"])
-            if "skip_se_api_at_night" in se_api_sec:
-                solaredge_api_kwargs["skip_at_night"] = _as_bool(se_api_sec["skip_se_api_at_night"])
-        solaredge_api_cfg = SolarEdgeAPIConfig(**solaredge_api_kwargs)
-
-
-        # --- State ---
-        state_kwargs = {}
-        if "state" in p and "path" in p["state"]:
-            state_kwargs["path"] = p["state"]["path"]
-        state_cfg = StateConfig(**state_kwargs)
-
         # --- Simulation ---
         sim_scenario: str | None = None
         sim_settings: dict[str, str] = {}
         sim_time: str | None = None
-        if "simulation" in p:
-            sim_sec = p["simulation"]
-            if "scenario" in sim_sec:
-                sim_scenario_raw = sim_sec["scenario"].strip()
-                sim_scenario = sim_scenario_raw or None
-            if "simulated_time" in sim_sec:
-                sim_time_raw = sim_sec["simulated_time"].strip()
-                sim_time = sim_time_raw or None
-            for key, value in sim_sec.items():
-                if key in {"scenario", "simulated_time"}:
-                    continue
-                sim_settings[key] = value
-
-        sim_scenarios: dict[str, dict[str, str]] = {}
-        for section in p.sections():
-            if not section.startswith("simulation:"):
+        sim_sec = p.get("simulation", {})
+        if "scenario" in sim_sec:
+            sim_scenario_raw = sim_sec["scenario"].strip()
+            sim_scenario = sim_scenario_raw or None
+        if "simulated_time" in sim_sec:
+            sim_time_raw = sim_sec["simulated_time"].strip()
+            sim_time = sim_time_raw or None
+        for key, value in sim_sec.items():
+            if key in {"scenario", "simulated_time"}:
                 continue
-            scenario_name = section.split(":", 1)[1].strip()
-            if not scenario_name:
-                continue
-            sim_scenarios[scenario_name] = dict(p[section])
+            sim_settings[key] = value
+
+        # Sections were already copied into plain, uninterpolated dicts by Config(), so
+        # scenarios can share them rather than being copied a second time.
+        sim_scenarios: dict[str, dict[str, str]] = {
+            m.group(1): values
+            for section, values in p.items()
+            if (m := _SIM_SECTION_RE.match(section))
+        }
 
         simulation_cfg = SimulationConfig(
             scenario=sim_scenario,
@@ -380,86 +491,8 @@ class Config:
             scenarios=sim_scenarios,
         )
 
-        if "retention" in p:
-            retention_sec = p["retention"]
-        else:
-            retention_sec = {}
-
-        retention_cfg = RetentionConfig(
-            snapshot_days=int(retention_sec.get("snapshot_days", 30) or 30),
-            summary_days=int(retention_sec.get("summary_days", 90) or 90),
-            incident_days=int(retention_sec.get("incident_days", 180) or 180),
-            incident_event_days=int(retention_sec.get("incident_event_days", 365) or 365),
-            health_counter_days=int(retention_sec.get("health_counter_days", 30) or 30),
-            vacuum_after_prune=(retention_sec.get("vacuum_after_prune", "true").strip().lower() == "true")
-            if retention_sec
-            else True,
-        )
-
-        # --- Weather ---
-        weather_kwargs = {}
-        if "weather" in p:
-            weather_sec = p["weather"]
-            if "enabled" in weather_sec:
-                weather_kwargs["enabled"] = _as_bool(weather_sec["enabled"])
-            if "provider" in weather_sec:
-                weather_kwargs["provider"] = weather_sec["provider"]
-            if "latitude" in weather_sec:
-                weather_kwargs["latitude"] = float(weather_sec["latitude"])
-            if "longitude" in weather_sec:
-                weather_kwargs["longitude"] = float(weather_sec["longitude"])
-            if "tilt_deg" in weather_sec:
-                weather_kwargs["tilt_deg"] = float(weather_sec["tilt_deg"])
-            if "azimuth_deg" in weather_sec:
-                weather_kwargs["azimuth_deg"] = float(weather_sec["azimuth_deg"])
-            if "albedo" in weather_sec:
-                weather_kwargs["albedo"] = float(weather_sec["albedo"])
-            if "array_kw_dc" in weather_sec:
-                weather_kwargs["array_kw_dc"] = float(weather_sec["array_kw_dc"])
-            if "ac_capacity_kw" in weather_sec:
-                weather_kwargs["ac_capacity_kw"] = float(weather_sec["ac_capacity_kw"])
-            if "dc_ac_derate" in weather_sec:
-                weather_kwargs["dc_ac_derate"] = float(weather_sec["dc_ac_derate"])
-            if "noct_c" in weather_sec:
-                weather_kwargs["noct_c"] = float(weather_sec["noct_c"])
-            if "temp_coeff_per_c" in weather_sec:
-                weather_kwargs["temp_coeff_per_c"] = float(weather_sec["temp_coeff_per_c"])
-            if "log_path" in weather_sec:
-                weather_kwargs["log_path"] = weather_sec["log_path"]
-        weather_cfg = WeatherConfig(**weather_kwargs)
-
-        logging_kwargs = {}
-        if "logging" in p:
-            logging_sec = p["logging"]
-            if "console_level" in logging_sec:
-                logging_kwargs["console_level"] = logging_sec["console_level"]
-            if "console_quiet" in logging_sec:
-                logging_kwargs["console_quiet"] = _as_bool(logging_sec["console_quiet"])
-            if "debug_modules" in logging_sec:
-                raw = logging_sec["debug_modules"]
-                logging_kwargs["debug_modules"] = [x.strip() for x in raw.split(",") if x.strip()]
-            if "structured_enabled" in logging_sec:
-                logging_kwargs["structured_enabled"] = _as_bool(logging_sec["structured_enabled"])
-            if "structured_path" in logging_sec:
-                logging_kwargs["structured_path"] = logging_sec["structured_path"]
-            if "log_path" in logging_sec:
-                logging_kwargs["log_path"] = logging_sec["log_path"]
-            if "log_max_bytes" in logging_sec:
-                logging_kwargs["log_max_bytes"] = int(logging_sec["log_max_bytes"])
-            if "log_backup_count" in logging_sec:
-                logging_kwargs["log_backup_count"] = int(logging_sec["log_backup_count"])
-        logging_cfg = LoggingConfig(**logging_kwargs)
-
         return AppConfig(
             modbus=modbus,
-            pushover=pushover,
-            healthchecks=healthchecks,
-            health=health_cfg,
-            daylight=daylight_cfg,
-            solaredge_api=solaredge_api_cfg,
-            state=state_cfg,
             simulation=simulation_cfg,
-            retention=retention_cfg,
-            weather=weather_cfg,
-            logging=logging_cfg,
+            **_build_sections(p),
         )
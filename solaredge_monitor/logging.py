@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import logging.handlers
 import sys
-from dataclasses import dataclass, asdict, is_dataclass
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 
 def _default_logger_name() -> logging.Logger:
@@ -62,8 +70,8 @@ class ConsoleLog:
             file_handler.setFormatter(fmt)
             root.addHandler(file_handler)
 
-        for name in self.debug_modules:
-            logging.getLogger(name).setLevel(logging.DEBUG)
+        for name in dict.fromkeys(self.debug_modules):
+            get_logger(name).setLevel(logging.DEBUG)
 
         return _default_logger_name()
 
@@ -83,8 +91,60 @@ class RunLogEntry:
     optimizer_counts: dict[str, Any] | None
 
 
+_ENTRY_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(RunLogEntry))
+
+# json.dumps(default=...) builds a fresh encoder per call; build it once instead.
+# Compact separators match orjson's output and keep each JSONL line smaller.
+_ENCODE = json.JSONEncoder(default=str, separators=(",", ":")).encode
+
+
 def _to_jsonable(obj: Any) -> Any:
     """Best-effort conversion to JSON-safe structures."""
+    # Exact-type dispatch covers almost every node in a run entry; anything else takes
+    # the isinstance chain below.
+    convert = _FAST_CONVERTERS.get(type(obj))
+    if convert is not None:
+        return convert(obj)
+    return _to_jsonable_slow(obj)
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+def _dict_to_jsonable(obj: dict) -> dict:
+    return {k: _to_jsonable(v) for k, v in obj.items()}
+
+
+def _seq_to_jsonable(obj: Iterable[Any]) -> list:
+    return [_to_jsonable(x) for x in obj]
+
+
+_FAST_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    dict: _dict_to_jsonable,
+    list: _seq_to_jsonable,
+    tuple: _seq_to_jsonable,
+}
+
+
+def _dataclass_serializer(cls: type) -> Callable[[Any], dict]:
+    """Build a converter for one dataclass type that fetches all fields in a single call."""
+    names = tuple(f.name for f in fields(cls))
+    if not names:
+        return lambda obj: {}
+    if len(names) == 1:
+        (name,) = names
+        return lambda obj: {name: _to_jsonable(getattr(obj, name))}
+    getter = attrgetter(*names)
+    return lambda obj: dict(zip(names, map(_to_jsonable, getter(obj))))
+
+
+def _to_jsonable_slow(obj: Any) -> Any:
     if obj is None:
         return None
     if isinstance(obj, (str, int, float, bool)):
@@ -96,41 +156,75 @@ def _to_jsonable(obj: Any) -> Any:
             return obj.isoformat()
         except Exception:
             pass
-    if is_dataclass(obj):
-        return _to_jsonable(asdict(obj))
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # Register the type so later instances take the fast dispatch path.
+        convert = _FAST_CONVERTERS[type(obj)] = _dataclass_serializer(type(obj))
+        return convert(obj)
     if hasattr(obj, "as_dict") and callable(getattr(obj, "as_dict")):
         try:
             return _to_jsonable(obj.as_dict())
         except Exception:
             pass
     if isinstance(obj, dict):
-        return {k: _to_jsonable(v) for k, v in obj.items()}
+        return _dict_to_jsonable(obj)
     if isinstance(obj, (list, tuple, set)):
-        return [_to_jsonable(x) for x in obj]
+        return _seq_to_jsonable(obj)
     if hasattr(obj, "__dict__"):
         return _to_jsonable(vars(obj))
     return str(obj)
 
 
+def _encode_entry(entry: RunLogEntry) -> bytes:
+    """Encode one run entry as a newline-terminated JSON line."""
+    if orjson is not None:
+        # orjson walks dataclasses, dicts and datetimes natively; anything it does
+        # not know (paths, plain objects) goes through _to_jsonable.
+        try:
+            return orjson.dumps(
+                entry,
+                default=_to_jsonable,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            pass
+    payload = {name: _to_jsonable(getattr(entry, name)) for name in _ENTRY_FIELDS}
+    return (_ENCODE(payload) + "\n").encode("utf-8")
+
+
 class StructuredLog:
     """Structured, machine-readable logging (JSONL today; extensible later)."""
 
     def __init__(self, path: str | None, enabled: bool = False):
         self.enabled = enabled and bool(path)
         self.path = Path(path).expanduser() if path else None
+        self._fh = None
         if self.enabled and self.path:
             self.path.parent.mkdir(parents=True, exist_ok=True)
+            atexit.register(self.close)
 
     def write(self, entry: RunLogEntry) -> None:
         if not self.enabled or not self.path:
             return
-        payload = _to_jsonable(asdict(entry))
         try:
-            with self.path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(payload, default=str) + "\n")
+            data = _encode_entry(entry)
+            if self._fh is None:
+                # Unbuffered: each entry reaches the file in a single write.
+                self._fh = self.path.open("ab", buffering=0)
+            self._fh.write(data)
         except Exception as exc:  # pragma: no cover - best-effort logging
+            self.close()
             logging.getLogger(__name__).debug("Structured log write skipped: %s", exc)
 
+    def close(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError:
+                pass
+
 
+@lru_cache(maxsize=128)
 def get_logger(name: str) -> logging.Logger:
+    # Loggers live for the whole process, so the manager lookup only needs doing once.
     return logging.getLogger(name)
@@ -1,11 +1,22 @@
 # solaredge_monitor/main.py
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 import logging
+import os
 from pathlib import Path
 import json
+import sys
 
-from .cli import build_parser
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from .cli import build_parser, fast_health_args
 from .config import Config
 from .logging import ConsoleLog, StructuredLog, RunLogEntry
 
@@ -28,59 +39,172 @@ from .models.inverter import InverterSnapshot
 from .models.weather import WeatherEstimate
 
 
+def _encode_jsonl(rows: list[dict]) -> bytes:
+    """Encode rows as newline-terminated JSON lines (orjson when installed)."""
+    if orjson is not None:
+        return b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+    return "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows).encode("utf-8")
+
+
+class CloudPhase(Enum):
+    """What the SolarEdge cloud API is used for on this run."""
+
+    FETCH_ALL = "fetch_all"  # inventory + optimizer counts checked against expectations
+    FETCH_INVENTORY_ONLY = "fetch_inventory_only"  # inventory + counts, nothing to check
+    SKIP_WITH_WARN = "skip_with_warn"  # skipped at night while optimizer checks are configured
+    SKIP_SILENT = "skip_silent"  # API disabled, or skipped with nothing depending on it
+
+    @property
+    def polls(self) -> bool:
+        return self in (CloudPhase.FETCH_ALL, CloudPhase.FETCH_INVENTORY_ONLY)
+
+
+def _classify_cloud(
+    enabled: bool,
+    skip_cloud: bool,
+    has_optimizer_expectations: bool,
+) -> CloudPhase:
+    if not enabled:
+        return CloudPhase.SKIP_SILENT
+    if skip_cloud:
+        return CloudPhase.SKIP_WITH_WARN if has_optimizer_expectations else CloudPhase.SKIP_SILENT
+    if has_optimizer_expectations:
+        return CloudPhase.FETCH_ALL
+    return CloudPhase.FETCH_INVENTORY_ONLY
+
+
+class _JsonlAppender:
+    """Append-only file descriptors cached per path for the life of the process.
+
+    Writes go through O_APPEND so each payload lands at the end of the file in one
+    write(2); a descriptor is reopened when its file was rotated or removed.
+    """
+
+    def __init__(self):
+        self._fds: dict[str, int] = {}
+        atexit.register(self.close)
+
+    def _fd(self, path: str) -> int:
+        fd = self._fds.get(path)
+        if fd is not None:
+            try:
+                if os.stat(path).st_ino == os.fstat(fd).st_ino:
+                    return fd
+            except OSError:
+                pass
+            self._close(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd = self._fds[path] = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return fd
+
+    def write(self, path: str, payload: bytes) -> None:
+        os.write(self._fd(path), payload)
+
+    def _close(self, path: str) -> None:
+        fd = self._fds.pop(path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        for path in list(self._fds):
+            self._close(path)
+
+
+_WEATHER_JSONL = _JsonlAppender()
+
+
+@lru_cache(maxsize=4)
+def _resolved_log_path(path: str) -> str:
+    """Expand ~ once per configured path; the appender creates the directory on open."""
+    return str(Path(path).expanduser())
+
+
 def _log_weather_jsonl(path: str, run_ts, weather_estimate, snapshot_map, log) -> None:
     """Temporary JSONL logger for model tuning; safe to remove when no longer needed."""
     if not path or weather_estimate is None:
         return
     try:
-        target = Path(path).expanduser()
-        target.parent.mkdir(parents=True, exist_ok=True)
-        pac_map = {}
-        if snapshot_map:
-            for name, snap in snapshot_map.items():
-                if snap and snap.pac_w is not None:
-                    pac_map[name] = snap.pac_w
-        # Skip logging when we have no inverter power data (nighttime/offline) or sun is below the horizon.
-        if not pac_map:
+        snap = weather_estimate.snapshot
+        # Skip logging when the sun is below the horizon.
+        if snap.sun_elevation_deg is not None and snap.sun_elevation_deg <= 0:
             return
-        if weather_estimate.snapshot.sun_elevation_deg is not None and weather_estimate.snapshot.sun_elevation_deg <= 0:
+        per_inverter = weather_estimate.per_inverter
+        # Only inverters with both live power and an expectation (none at night/offline).
+        paired = snapshot_map.keys() & per_inverter.keys() if snapshot_map else ()
+        pac_map = {
+            name: pac_w
+            for name in paired
+            if (pac_w := getattr(snapshot_map[name], "pac_w", None)) is not None
+        }
+        if not pac_map:
             return
-
-        snap = weather_estimate.snapshot
-        with target.open("a", encoding="utf-8") as fh:
-            for name, inv in weather_estimate.per_inverter.items():
-                row = {
-                    "run_ts": run_ts.isoformat(),
-                    "inverter": name,
-                    "pac_w": pac_map.get(name),
-                    "expected_ac_kw": inv.expected_ac_kw,
-                    "expected_dc_kw": inv.expected_dc_kw,
-                    "poa_wm2": inv.poa_wm2,
-                    "cos_incidence": inv.cos_incidence,
-                    "ghi_wm2": snap.ghi_wm2,
-                    "dni_wm2": snap.dni_wm2,
-                    "diffuse_wm2": snap.diffuse_wm2,
-                    "cloud_cover_pct": snap.cloud_cover_pct,
-                    "temp_c": snap.temp_c,
-                    "sun_azimuth_deg": snap.sun_azimuth_deg,
-                    "sun_elevation_deg": snap.sun_elevation_deg,
-                    "array_kw_dc": inv.array_kw_dc,
-                    "ac_capacity_kw": inv.ac_capacity_kw,
-                    "dc_ac_derate": inv.dc_ac_derate,
-                    "noct_c": inv.noct_c,
-                    "temp_coeff_per_c": inv.temp_coeff_per_c,
-                    "tilt_deg": inv.tilt_deg,
-                    "azimuth_deg": inv.azimuth_deg,
-                    "albedo": inv.albedo,
-                    "provider": snap.provider,
-                    "source_latitude": snap.source_latitude,
-                    "source_longitude": snap.source_longitude,
-                }
-                fh.write(json.dumps(row) + "\n")
+        # Snapshot-wide fields are shared by every row; each row adds its inverter's.
+        base = {
+            "run_ts": run_ts.isoformat(),
+            "ghi_wm2": snap.ghi_wm2,
+            "dni_wm2": snap.dni_wm2,
+            "diffuse_wm2": snap.diffuse_wm2,
+            "cloud_cover_pct": snap.cloud_cover_pct,
+            "temp_c": snap.temp_c,
+            "sun_azimuth_deg": snap.sun_azimuth_deg,
+            "sun_elevation_deg": snap.sun_elevation_deg,
+            "provider": snap.provider,
+            "source_latitude": snap.source_latitude,
+            "source_longitude": snap.source_longitude,
+        }
+        rows = [
+            base
+            | {
+                "inverter": name,
+                "pac_w": pac_map[name],
+                "expected_ac_kw": inv.expected_ac_kw,
+                "expected_dc_kw": inv.expected_dc_kw,
+                "poa_wm2": inv.poa_wm2,
+                "cos_incidence": inv.cos_incidence,
+                "array_kw_dc": inv.array_kw_dc,
+                "ac_capacity_kw": inv.ac_capacity_kw,
+                "dc_ac_derate": inv.dc_ac_derate,
+                "noct_c": inv.noct_c,
+                "temp_coeff_per_c": inv.temp_coeff_per_c,
+                "tilt_deg": inv.tilt_deg,
+                "azimuth_deg": inv.azimuth_deg,
+                "albedo": inv.albedo,
+            }
+            for name, inv in per_inverter.items()
+            if name in pac_map
+        ]
+        # One encoded blob per run, appended with a single write.
+        _WEATHER_JSONL.write(_resolved_log_path(path), _encode_jsonl(rows))
     except Exception as exc:  # pragma: no cover - non-critical logging
         log.debug("Weather tuning log skipped: %s", exc)
 
 
+def _build_residuals(snapshot_map, per_inverter) -> dict[str, dict[str, float | None]]:
+    """Measured vs. weather-expected AC power for inverters that have both."""
+    # (pac_w, expected_w) pairs, filtered once before the per-inverter dicts are built.
+    paired = {
+        name: (snap.pac_w, inv.expected_ac_kw * 1000)
+        for name, snap in snapshot_map.items()
+        if snap is not None
+        and snap.pac_w is not None
+        and (inv := per_inverter.get(name)) is not None
+        and inv.expected_ac_kw is not None
+        and inv.expected_ac_kw > 0
+    }
+    return {
+        name: {
+            "pac_w": pac_w,
+            "expected_ac_w": expected_w,
+            "residual_w": pac_w - expected_w,
+            "ratio": pac_w / expected_w,
+        }
+        for name, (pac_w, expected_w) in paired.items()
+    }
+
+
 def _build_capacity_map(app_cfg, weather_estimate: WeatherEstimate | None) -> dict[str, float]:
     """Resolve per-inverter AC capacity (kW) from config/weather data."""
     caps: dict[str, float] = {}
@@ -201,23 +325,22 @@ def run_notify_test(notifier: NotificationManager, log, mode: str) -> None:
 def collect_modbus_snapshots(reader, state, now, log):
     snapshots_raw = reader.read_all()
     if isinstance(snapshots_raw, dict):
-        snapshot_items = list(snapshots_raw.items())
         snapshot_map = snapshots_raw
     else:
-        snapshot_items = [(s.name, s) for s in snapshots_raw]
-        snapshot_map = {name: snap for name, snap in snapshot_items}
+        snapshot_map = {s.name: s for s in snapshots_raw}
 
-    serial_by_name: dict[str, str] = {}
-    for name, snap in snapshot_map.items():
-        if snap is None:
-            continue
-        serial = (snap.serial or name).upper()
-        serial_by_name[name] = serial
-        state.update_inverter_serial(name, serial)
-        if snap.total_wh is not None:
-            state.update_latest_total(serial, now.date(), snap.total_wh)
+    serial_by_name = {
+        name: (snap.serial or name).upper()
+        for name, snap in snapshot_map.items()
+        if snap is not None
+    }
+    totals = {serial: snapshot_map[name].total_wh for name, serial in serial_by_name.items()}
+    # Two executemany calls in one transaction (one fsync) for the whole batch.
+    with state.transaction():
+        state.update_inverter_serials(serial_by_name)
+        state.update_latest_totals(now.date(), totals)
 
-    return snapshot_map, snapshot_items, serial_by_name
+    return snapshot_map, serial_by_name
 
 
 def run_daily_summary(
@@ -264,8 +387,8 @@ def run_daily_summary(
 
 
 def main():
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    args = fast_health_args(argv) or build_parser(argv).parse_args(argv)
 
     app_cfg = Config.load(args.config)
     console_logger = ConsoleLog(
@@ -302,6 +425,8 @@ def main():
                 incident_event_days=getattr(app_cfg.retention, "incident_event_days", summary_days),
                 health_counter_days=getattr(app_cfg.retention, "health_counter_days", summary_days),
                 vacuum=vacuum,
+                full_vacuum=getattr(args, "full_vacuum", False),
+                vacuum_page_limit=getattr(app_cfg.retention, "vacuum_page_limit", 2000),
             )
         except TypeError:
             # Backward compatibility for older/mocked prune signatures.
@@ -347,7 +472,7 @@ def main():
             enabled=app_cfg.solaredge_api.enabled,
         )
     else:
-        se_client = SolarEdgeAPIClient(app_cfg.solaredge_api, log)
+        se_client = SolarEdgeAPIClient(app_cfg.solaredge_api, log, state=state)
 
     summary_service = DailySummaryService(app_cfg.modbus.inverters, se_client, log, state=state)
     alert_manager = AlertStateManager(
@@ -366,7 +491,35 @@ def main():
         else:
             reader = ModbusReader(app_cfg.modbus, log)
         now = sim_time_override or datetime.now(daylight_policy.timezone)
+        # Sun times come back already in the policy timezone, so they format directly.
         daylight_info = daylight_policy.get_info(now)
+        # Read the hot config/daylight attributes once; they are consulted several times below.
+        inverter_cfgs = app_cfg.modbus.inverters
+        skip_modbus = daylight_info.skip_modbus
+        skip_cloud = daylight_info.skip_cloud
+        cloud_phase = _classify_cloud(
+            se_client.enabled,
+            skip_cloud,
+            app_cfg.modbus.has_optimizer_expectations,
+        )
+        poll_cloud = cloud_phase.polls
+
+        # Fully idle tick (typically overnight): nothing to poll, log or summarise, so
+        # skip evaluation and alert bookkeeping entirely.
+        if (
+            skip_modbus
+            and not poll_cloud
+            and not (weather_client.enabled and not use_simulation)
+            and not structured_logger.enabled
+            and not summary_service.should_run(now.date(), daylight_info)
+        ):
+            log.debug(
+                "Nighttime phase detected (%s); nothing to poll until sunrise %s",
+                daylight_info.phase,
+                daylight_info.sunrise.strftime("%H:%M"),
+            )
+            state.flush()
+            return
 
         cloud_inverters = []
         cloud_by_serial = {}
@@ -375,49 +528,55 @@ def main():
         serial_by_name: dict[str, str] = {}
         weather_estimate = None
 
-        if daylight_info.skip_modbus:
+        # The weather lookup is plain HTTP with no state access, so run it in the
+        # background while Modbus and the SolarEdge API (which use the SQLite state
+        # on this thread) are polled.
+        weather_future = None
+        if not use_simulation and weather_client.enabled:
+            weather_pool = ThreadPoolExecutor(max_workers=1)
+            weather_future = weather_pool.submit(
+                weather_client.fetch,
+                now,
+                inverter_cfgs,
+                fallback_lat=app_cfg.daylight.latitude,
+                fallback_lon=app_cfg.daylight.longitude,
+            )
+            weather_pool.shutdown(wait=False)
+
+        if skip_modbus:
             log.debug(
                 "Nighttime phase detected (%s); skipping Modbus polling until sunrise %s",
                 daylight_info.phase,
-                daylight_info.sunrise.astimezone(daylight_policy.timezone).strftime("%H:%M"),
+                daylight_info.sunrise.strftime("%H:%M"),
             )
             snapshot_map = {}
-            snapshot_items = []
             serial_by_name = {}
         else:
-            snapshot_map, snapshot_items, serial_by_name = collect_modbus_snapshots(
+            snapshot_map, serial_by_name = collect_modbus_snapshots(
                 reader, state, now, log
             )
 
-        if not use_simulation and weather_client.enabled:
-            weather_estimate = weather_client.fetch(
-                now,
-                app_cfg.modbus.inverters,
-                fallback_lat=app_cfg.daylight.latitude,
-                fallback_lon=app_cfg.daylight.longitude,
-            )
+        # Fill gaps from cached serials; names Modbus already resolved need no lookup.
+        for cfg in inverter_cfgs:
+            if cfg.name not in serial_by_name and (serial := state.get_inverter_serial(cfg.name)):
+                serial_by_name[cfg.name] = serial.upper()
 
-        for cfg in app_cfg.modbus.inverters:
-            serial = state.get_inverter_serial(cfg.name)
-            if serial:
-                serial_by_name.setdefault(cfg.name, serial.upper())
-
-        if se_client.enabled and not daylight_info.skip_cloud:
+        if poll_cloud:
             cloud_inverters = se_client.fetch_inverters()
-            for inv in cloud_inverters:
-                raw_serial = inv.serial or ""
-                serial = raw_serial.upper()
-                if not serial:
-                    continue
-                cloud_by_serial[serial] = inv
-                cloud_by_serial[raw_serial] = inv
+            # Keyed by upper-cased serial only; every consumer looks up serial.upper().
+            cloud_by_serial = {inv.serial.upper(): inv for inv in cloud_inverters if inv.serial}
+            for serial, inv in cloud_by_serial.items():
                 serial_by_name.setdefault(inv.name, serial)
+
+        if weather_future is not None:
+            weather_estimate = weather_future.result()
+
         # --- stdout output ---
         if not args.quiet:
             if args.json:
-                emit_json(snapshot_items, cloud_by_serial, weather_estimate=weather_estimate)
+                emit_json(snapshot_map, cloud_by_serial, weather_estimate=weather_estimate)
             else:
-                emit_human(snapshot_items, cloud_by_serial, weather_estimate=weather_estimate)
+                emit_human(snapshot_map, cloud_by_serial, weather_estimate=weather_estimate)
 
         health = None
         sun_el = weather_estimate.snapshot.sun_elevation_deg if weather_estimate else None
@@ -444,7 +603,7 @@ def main():
             log,
             thresholds,
         ) if snapshot_map else {}
-        if snapshot_items:
+        if snapshot_map:
             health = evaluator.evaluate(
                 snapshot_map,
                 low_light_grace=daylight_info.in_grace_window,
@@ -456,25 +615,24 @@ def main():
             )
 
         optimizer_mismatches: list[tuple[str, int, int | None]] = []
-        has_optimizer_expectations = any(
-            inv_cfg.expected_optimizers is not None for inv_cfg in app_cfg.modbus.inverters
-        )
 
-        if se_client.enabled and not daylight_info.skip_cloud:
-            optimizer_counts_by_serial = se_client.get_optimizer_counts(cloud_inverters or None)
-        if se_client.enabled and not daylight_info.skip_cloud and has_optimizer_expectations:
-            log.debug(
-                "Optimizer counts fetched: %s",
-                {k: optimizer_counts_by_serial[k] for k in sorted(optimizer_counts_by_serial)},
-            )
-            optimizer_mismatches = evaluator.update_with_optimizer_counts(
-                health,
-                app_cfg.modbus.inverters,
-                serial_by_name,
-                optimizer_counts_by_serial,
-            )
-        elif se_client.enabled and daylight_info.skip_cloud and has_optimizer_expectations:
-            log.debug("SolarEdge API polling skipped at night (configuration).")
+        match cloud_phase:
+            case CloudPhase.FETCH_ALL:
+                optimizer_counts_by_serial = se_client.get_optimizer_counts(cloud_inverters or None)
+                log.debug(
+                    "Optimizer counts fetched: %s",
+                    {k: optimizer_counts_by_serial[k] for k in sorted(optimizer_counts_by_serial)},
+                )
+                optimizer_mismatches = evaluator.update_with_optimizer_counts(
+                    health,
+                    inverter_cfgs,
+                    serial_by_name,
+                    optimizer_counts_by_serial,
+                )
+            case CloudPhase.FETCH_INVENTORY_ONLY:
+                optimizer_counts_by_serial = se_client.get_optimizer_counts(cloud_inverters or None)
+            case CloudPhase.SKIP_WITH_WARN:
+                log.debug("SolarEdge API polling skipped at night (configuration).")
 
         alerts, recoveries, has_active_health_incident = alert_manager.build_notification_batch(
             now=now,
@@ -482,18 +640,11 @@ def main():
             optimizer_mismatches=optimizer_mismatches,
         )
 
-        if log.isEnabledFor(logging.DEBUG):
-            for alert in alerts:
-                log.debug(
-                    "Alert [%s] serial=%s status=%s pac=%s reason=%s",
-                    alert.inverter_name,
-                    alert.serial,
-                    alert.status,
-                    alert.pac_w,
-                    alert.message,
-                )
+        if alerts and log.isEnabledFor(logging.DEBUG):
+            # One record for the whole batch, each entry in Alert's compact str() form.
+            log.debug("Alerts[%d]: %s", len(alerts), "; ".join(map(str, alerts)))
 
-        if daylight_info.skip_modbus:
+        if skip_modbus:
             log.debug(
                 "Modbus polling skipped; suppressing Healthchecks ping until monitoring resumes."
             )
@@ -533,8 +684,8 @@ def main():
                 "is_daylight": daylight_info.is_daylight,
                 "in_grace_window": daylight_info.in_grace_window,
                 "production_day_over": daylight_info.production_day_over,
-                "skip_modbus": daylight_info.skip_modbus,
-                "skip_cloud": daylight_info.skip_cloud,
+                "skip_modbus": skip_modbus,
+                "skip_cloud": skip_cloud,
                 "sunrise": getattr(daylight_info, "sunrise", None),
                 "sunrise_grace_end": getattr(daylight_info, "sunrise_grace_end", None),
                 "sunset": getattr(daylight_info, "sunset", None),
@@ -544,23 +695,7 @@ def main():
 
         residuals = None
         if snapshot_map and weather_estimate and weather_estimate.per_inverter:
-            res_map: dict[str, dict[str, float | None]] = {}
-            for name, snap in snapshot_map.items():
-                inv = weather_estimate.per_inverter.get(name)
-                if not inv or snap is None:
-                    continue
-                if snap.pac_w is None or inv.expected_ac_kw is None:
-                    continue
-                expected_w = inv.expected_ac_kw * 1000
-                if expected_w <= 0:
-                    continue
-                res_map[name] = {
-                    "pac_w": snap.pac_w,
-                    "expected_ac_w": expected_w,
-                    "residual_w": snap.pac_w - expected_w,
-                    "ratio": snap.pac_w / expected_w if expected_w else None,
-                }
-            residuals = res_map or None
+            residuals = _build_residuals(snapshot_map, weather_estimate.per_inverter) or None
 
         if structured_logger.enabled:
             run_entry = RunLogEntry(
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DaylightInfo:
     is_daylight: bool
     phase: str  # NIGHT, DAY, SUNRISE_GRACE, SUNSET_GRACE
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InverterSnapshot:
     name: str
     serial: str
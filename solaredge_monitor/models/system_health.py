@@ -4,7 +4,7 @@ from typing import Optional, Dict
 from solaredge_monitor.models.inverter import InverterSnapshot
 
 
-@dataclass
+@dataclass(slots=True)
 class InverterHealth:
     name: str
     inverter_ok: bool
@@ -13,7 +13,7 @@ class InverterHealth:
     fault_code: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemHealth:
     system_ok: bool
     per_inverter: Dict[str, InverterHealth]
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeatherSnapshot:
     timestamp: datetime
     source_series_time: Optional[datetime]
@@ -24,7 +24,7 @@ class WeatherSnapshot:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InverterExpectation:
     name: str
     expected_dc_kw: Optional[float]
@@ -43,7 +43,7 @@ class InverterExpectation:
     temp_coeff_per_c: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WeatherEstimate:
     snapshot: WeatherSnapshot
     per_inverter: Dict[str, InverterExpectation]
@@ -8,7 +8,7 @@ from typing import List
 from solaredge_monitor.models.system_health import InverterHealth, SystemHealth
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Alert:
     inverter_name: str
     serial: str
@@ -17,6 +17,13 @@ class Alert:
     status: int
     pac_w: float | None
 
+    def __str__(self) -> str:
+        # Compact one-line form for logs; the dataclass __repr__ is left intact.
+        return (
+            f"Alert [{self.inverter_name}] serial={self.serial} status={self.status} "
+            f"pac={self.pac_w} reason={self.message}"
+        )
+
 
 def _snapshot_details(inv: InverterHealth) -> tuple[str, int, float | None]:
     snap = inv.reading
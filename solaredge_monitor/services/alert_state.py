@@ -9,6 +9,25 @@ from solaredge_monitor.services.alert_logic import Alert, evaluate_alerts
 from solaredge_monitor.models.system_health import SystemHealth
 
 
+_OPTIMIZER_MISMATCH_MSG = "Optimizer count mismatch (expected {}, cloud={})".format
+
+
+def _optimizer_mismatch_alert(name: str, expected: int, actual: int | None) -> Alert:
+    # Positional order: inverter_name, serial, fault_code, message, status, pac_w.
+    return Alert(
+        name,
+        "CLOUD",
+        "optimizer_mismatch",
+        _OPTIMIZER_MISMATCH_MSG(expected, "unknown" if actual is None else actual),
+        -1,
+        None,
+    )
+
+
+def _system_message_alert(message: str) -> Alert:
+    return Alert("SYSTEM", "SYSTEM", "system_message", message, -1, None)
+
+
 @dataclass
 class RecoveryNotification:
     inverter_name: str
@@ -88,26 +107,21 @@ class AlertStateManager:
         recovery_counters: dict[str, int],
         health: SystemHealth,
     ) -> bool:
-        changed = False
-        for name, inv_state in health.per_inverter.items():
-            key = name
-            if inv_state.inverter_ok:
-                if counters.get(key, 0) != 0:
-                    counters[key] = 0
-                    changed = True
-                prev_recovery = recovery_counters.get(key, 0)
-                recovery_counters[key] = prev_recovery + 1
-                if recovery_counters[key] != prev_recovery:
-                    changed = True
-                continue
-            if recovery_counters.get(key, 0) != 0:
-                recovery_counters[key] = 0
-                changed = True
-            prev = counters.get(key, 0)
-            counters[key] = prev + 1
-            if counters[key] != prev:
-                changed = True
-        return changed
+        per_inverter = health.per_inverter
+        counters.update(
+            {
+                name: 0 if inv.inverter_ok else counters.get(name, 0) + 1
+                for name, inv in per_inverter.items()
+            }
+        )
+        recovery_counters.update(
+            {
+                name: recovery_counters.get(name, 0) + 1 if inv.inverter_ok else 0
+                for name, inv in per_inverter.items()
+            }
+        )
+        # Every evaluated inverter advances one of its two counters.
+        return bool(per_inverter)
 
     def _filter_by_consecutive(
         self,
@@ -117,15 +131,12 @@ class AlertStateManager:
         if self.consecutive_required <= 1:
             return alerts
 
-        gated: list[Alert] = []
-        for alert in alerts:
-            if alert.inverter_name == "SYSTEM":
-                gated.append(alert)
-                continue
-            count = counters.get(alert.inverter_name, 0)
-            if count >= self.consecutive_required:
-                gated.append(alert)
-        return gated
+        required = self.consecutive_required
+        return [
+            alert
+            for alert in alerts
+            if alert.inverter_name == "SYSTEM" or counters.get(alert.inverter_name, 0) >= required
+        ]
 
     def _parse_dt(self, raw: object) -> Optional[datetime]:
         if not raw or not isinstance(raw, str):
@@ -231,30 +242,11 @@ class AlertStateManager:
                 health_alerts = evaluate_alerts(health, now)
                 alerts.extend(self._filter_by_consecutive(counters, health_alerts))
 
-            for name, expected, actual in optimizer_mismatches_list:
-                actual_txt = "unknown" if actual is None else str(actual)
-                alerts.append(
-                    Alert(
-                        inverter_name=name,
-                        serial="CLOUD",
-                        fault_code="optimizer_mismatch",
-                        message=f"Optimizer count mismatch (expected {expected}, cloud={actual_txt})",
-                        status=-1,
-                        pac_w=None,
-                    )
-                )
-
-            for msg in extra_messages_list:
-                alerts.append(
-                    Alert(
-                        inverter_name="SYSTEM",
-                        serial="SYSTEM",
-                        fault_code="system_message",
-                        message=msg,
-                        status=-1,
-                        pac_w=None,
-                    )
-                )
+            alerts.extend(
+                _optimizer_mismatch_alert(name, expected, actual)
+                for name, expected, actual in optimizer_mismatches_list
+            )
+            alerts.extend(map(_system_message_alert, extra_messages_list))
 
             emitted: list[Alert] = []
             current_names = {alert.inverter_name for alert in alerts}
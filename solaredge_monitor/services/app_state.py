@@ -7,15 +7,71 @@ import logging
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Mapping, Optional, Union, TYPE_CHECKING
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 if TYPE_CHECKING:
     from solaredge_monitor.models.inverter import InverterSnapshot
     from solaredge_monitor.models.system_health import SystemHealth
     from solaredge_monitor.services.se_api_client import CloudInverter
 
 
+# Stored JSON is machine-read only, so skip the default ", " / ": " padding.
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _loads(payload: str):
+    """Decode a stored kv value, with orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # The stdlib encoder may have written NaN/Infinity, which orjson rejects.
+            pass
+    return json.loads(payload)
+
+
+# Every serial-keyed accessor upper-cases its argument, and a run passes the same
+# handful of serials each time; memoize so each distinct spelling is folded once.
+_serial_key = lru_cache(maxsize=128)(str.upper)
+
+
+# Statements issued on every run, kept as single-line module constants so each call
+# (and the single-row/bulk variants that share one) hits sqlite3's statement cache.
+_SQL_GET_KV = "SELECT value FROM kv_store WHERE key = ?"
+_SQL_SET_KV = (
+    "INSERT INTO kv_store(key, value) VALUES (?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value=excluded.value"
+)
+_SQL_GET_SERIAL = "SELECT serial FROM inverter_serials WHERE name = ?"
+_SQL_SET_SERIAL = (
+    "INSERT INTO inverter_serials(name, serial) VALUES (?, ?) "
+    "ON CONFLICT(name) DO UPDATE SET serial=excluded.serial"
+)
+_SQL_GET_LATEST_TOTAL = "SELECT day, total_wh FROM latest_totals WHERE serial = ?"
+_SQL_SET_LATEST_TOTAL = (
+    "INSERT INTO latest_totals(serial, day, total_wh) VALUES (?, ?, ?) "
+    "ON CONFLICT(serial) DO UPDATE SET day=excluded.day, total_wh=excluded.total_wh"
+)
+_SQL_GET_SUMMARY_BASELINE = "SELECT day, total_wh FROM summary_totals WHERE serial = ?"
+_SQL_SET_SUMMARY_BASELINE = (
+    "INSERT INTO summary_totals(serial, day, total_wh) VALUES (?, ?, ?) "
+    "ON CONFLICT(serial) DO UPDATE SET day=excluded.day, total_wh=excluded.total_wh"
+)
+_SQL_HAS_SITE_SUMMARY = "SELECT 1 FROM site_summaries WHERE day = ? LIMIT 1"
+_SQL_OPEN_INCIDENT_ID = "SELECT id FROM incidents WHERE incident_key = ? AND status = 'open'"
+_SQL_ADD_INCIDENT_EVENT = (
+    "INSERT INTO incident_events(incident_id, event_type, event_ts, message, payload_json) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
 def _day_str(day) -> str:
     if hasattr(day, "isoformat"):
         return day.isoformat()
@@ -33,12 +89,26 @@ class AppState:
             resolved = Path(path) if path else default_path
             resolved.parent.mkdir(parents=True, exist_ok=True)
             self.path: Optional[Path] = resolved
-            self._conn = sqlite3.connect(self.path)
+            self._conn = sqlite3.connect(self.path, cached_statements=256)
             self._conn.row_factory = sqlite3.Row
+            # Takes effect for new files; existing ones switch on their next full VACUUM.
+            self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
             self._conn.execute("PRAGMA journal_mode=WAL")
             self._conn.execute("PRAGMA synchronous=NORMAL")
+            # Wait out a concurrent writer (e.g. maintain-db from cron) instead of failing.
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.execute("PRAGMA wal_autocheckpoint=1000")
             self._conn.execute("PRAGMA temp_store=MEMORY")
+            # Bound the sampling PRAGMA optimize does when it decides to ANALYZE.
+            self._conn.execute("PRAGMA analysis_limit=1000")
+            self._optimized = False
             self._tx_depth = 0
+            # Read-through caches for lookups repeated within a run; every writer below
+            # keeps them current (and skips rewriting a value they already hold), and
+            # a rolled-back batch clears them.
+            self._kv_payloads: Dict[str, str] = {}
+            self._serial_cache: Dict[str, Optional[str]] = {}
+            self._latest_cache: Dict[str, tuple[Optional[str], Optional[float]]] = {}
             self._init_schema()
         else:
             self.path = None
@@ -60,31 +130,31 @@ class AppState:
             CREATE TABLE IF NOT EXISTS kv_store (
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL
-            )
+            ) WITHOUT ROWID
             """,
             """
             CREATE TABLE IF NOT EXISTS inverter_serials (
                 name TEXT PRIMARY KEY,
                 serial TEXT NOT NULL
-            )
+            ) WITHOUT ROWID
             """,
             """
             CREATE TABLE IF NOT EXISTS latest_totals (
                 serial TEXT PRIMARY KEY,
                 day TEXT NOT NULL,
                 total_wh REAL
-            )
+            ) WITHOUT ROWID
             """,
             """
             CREATE TABLE IF NOT EXISTS summary_totals (
                 serial TEXT PRIMARY KEY,
                 day TEXT NOT NULL,
                 total_wh REAL
-            )
+            ) WITHOUT ROWID
             """,
             """
             CREATE TABLE IF NOT EXISTS inverter_snapshots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER PRIMARY KEY,
                 run_timestamp TEXT NOT NULL,
                 inverter_name TEXT NOT NULL,
                 serial TEXT,
@@ -100,6 +170,10 @@ class AppState:
             )
             """,
             """
+            CREATE INDEX IF NOT EXISTS ix_inverter_snapshots_run_ts_inverter
+            ON inverter_snapshots(run_timestamp, inverter_name)
+            """,
+            """
             CREATE TABLE IF NOT EXISTS site_summaries (
                 day TEXT PRIMARY KEY,
                 recorded_at TEXT NOT NULL,
@@ -174,7 +248,21 @@ class AppState:
     # ------------------------------------------------------------------
     def flush(self) -> None:
         if self._persist and self._conn:
-            self._conn.commit()
+            if self._conn.in_transaction:
+                self._conn.commit()
+            if not self._optimized:
+                # Once per process: refresh planner statistics only where they went stale.
+                self._optimized = True
+                try:
+                    self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error as exc:  # pragma: no cover - best effort
+                    self._log.debug("PRAGMA optimize skipped: %s", exc)
+
+    def __enter__(self) -> "AppState":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
 
     @contextmanager
     def transaction(self):
@@ -182,8 +270,11 @@ class AppState:
             yield
             return
         outer = self._tx_depth == 0
-        if outer:
-            self._conn.execute("BEGIN")
+        # sqlite3 may already hold an implicit transaction from an uncommitted write;
+        # BEGIN would fail then, and committing at the end covers that work too.
+        # IMMEDIATE takes the write lock up front rather than upgrading mid-batch.
+        if outer and not self._conn.in_transaction:
+            self._conn.execute("BEGIN IMMEDIATE")
         self._tx_depth += 1
         try:
             yield
@@ -194,6 +285,9 @@ class AppState:
             self._tx_depth -= 1
             if outer:
                 self._conn.rollback()
+                self._kv_payloads.clear()
+                self._serial_cache.clear()
+                self._latest_cache.clear()
             raise
 
     def _maybe_commit(self) -> None:
@@ -204,12 +298,13 @@ class AppState:
     def get(self, key: str, default=None):
         if not self._persist:
             return self._memory["kv"].get(key, default)
-        cur = self._conn.execute("SELECT value FROM kv_store WHERE key = ?", (key,))
+        cur = self._conn.execute(_SQL_GET_KV, (key,))
         row = cur.fetchone()
         if not row:
             return default
+        payload = self._kv_payloads[key] = row["value"]
         try:
-            return json.loads(row["value"])
+            return _loads(payload)
         except json.JSONDecodeError:
             return default
 
@@ -217,34 +312,46 @@ class AppState:
         if not self._persist:
             self._memory["kv"][key] = value
             return
-        payload = json.dumps(value)
-        self._conn.execute(
-            """
-            INSERT INTO kv_store(key, value)
-            VALUES (?, ?)
-            ON CONFLICT(key) DO UPDATE SET value=excluded.value
-            """,
-            (key, payload),
-        )
-        self._conn.commit()
+        payload = _dumps(value)
+        if self._kv_payloads.get(key) == payload:
+            return
+        self._conn.execute(_SQL_SET_KV, (key, payload))
+        self._kv_payloads[key] = payload
+        self._maybe_commit()
 
     # Serial mappings -------------------------------------------------
     def update_inverter_serial(self, name: str, serial: str) -> None:
         if not name or not serial:
             return
-        serial_fmt = serial.upper()
+        serial_fmt = _serial_key(serial)
         if not self._persist:
             self._memory["inverter_serials"][name] = serial_fmt
             return
-        self._conn.execute(
-            """
-            INSERT INTO inverter_serials(name, serial)
-            VALUES (?, ?)
-            ON CONFLICT(name) DO UPDATE SET serial=excluded.serial
-            """,
-            (name, serial_fmt),
-        )
-        self._conn.commit()
+        if self._serial_cache.get(name) == serial_fmt:
+            return
+        self._conn.execute(_SQL_SET_SERIAL, (name, serial_fmt))
+        self._serial_cache[name] = serial_fmt
+        self._maybe_commit()
+
+    def update_inverter_serials(self, serial_by_name: Mapping[str, str]) -> None:
+        """Upsert many name -> serial mappings with a single executemany."""
+        rows = [
+            (name, _serial_key(serial))
+            for name, serial in serial_by_name.items()
+            if name and serial
+        ]
+        if not rows:
+            return
+        if not self._persist:
+            self._memory["inverter_serials"].update(rows)
+            return
+        cached = self._serial_cache
+        rows = [row for row in rows if cached.get(row[0]) != row[1]]
+        if not rows:
+            return
+        self._conn.executemany(_SQL_SET_SERIAL, rows)
+        self._serial_cache.update(rows)
+        self._maybe_commit()
 
     def get_inverter_serial(self, name: str) -> Optional[str]:
         if not name:
@@ -252,62 +359,81 @@ class AppState:
         if not self._persist:
             serial = self._memory["inverter_serials"].get(name)
             return serial.upper() if serial else None
-        cur = self._conn.execute("SELECT serial FROM inverter_serials WHERE name = ?", (name,))
-        row = cur.fetchone()
-        return row["serial"].upper() if row else None
+        if name in self._serial_cache:
+            return self._serial_cache[name]
+        row = self._conn.execute(_SQL_GET_SERIAL, (name,)).fetchone()
+        serial = self._serial_cache[name] = row["serial"].upper() if row else None
+        return serial
 
     # Latest totals ---------------------------------------------------
     def update_latest_total(self, serial: str, day, total_wh: float) -> None:
         if not serial or total_wh is None:
             return
-        serial_fmt = serial.upper()
+        serial_fmt = _serial_key(serial)
         day_str = _day_str(day)
         if not self._persist:
             self._memory["latest_totals"][serial_fmt] = {"day": day_str, "total_wh": total_wh}
             return
-        self._conn.execute(
-            """
-            INSERT INTO latest_totals(serial, day, total_wh)
-            VALUES (?, ?, ?)
-            ON CONFLICT(serial) DO UPDATE SET day=excluded.day, total_wh=excluded.total_wh
-            """,
-            (serial_fmt, day_str, total_wh),
+        if self._latest_cache.get(serial_fmt) == (day_str, total_wh):
+            return
+        self._conn.execute(_SQL_SET_LATEST_TOTAL, (serial_fmt, day_str, total_wh))
+        self._latest_cache[serial_fmt] = (day_str, total_wh)
+        self._maybe_commit()
+
+    def update_latest_totals(self, day, totals: Mapping[str, float]) -> None:
+        """Upsert many serial -> lifetime Wh totals for one day with a single executemany."""
+        day_str = _day_str(day)
+        rows = [
+            (_serial_key(serial), day_str, total_wh)
+            for serial, total_wh in totals.items()
+            if serial and total_wh is not None
+        ]
+        if not rows:
+            return
+        if not self._persist:
+            latest = self._memory["latest_totals"]
+            for serial_fmt, _, total_wh in rows:
+                latest[serial_fmt] = {"day": day_str, "total_wh": total_wh}
+            return
+        cached = self._latest_cache
+        rows = [row for row in rows if cached.get(row[0]) != (day_str, row[2])]
+        if not rows:
+            return
+        self._conn.executemany(_SQL_SET_LATEST_TOTAL, rows)
+        self._latest_cache.update(
+            (serial_fmt, (day_str, total_wh)) for serial_fmt, _, total_wh in rows
         )
-        self._conn.commit()
+        self._maybe_commit()
 
     def get_latest_total(self, serial: str, day) -> Optional[float]:
         if not serial:
             return None
-        serial_fmt = serial.upper()
+        serial_fmt = _serial_key(serial)
         day_str = _day_str(day)
         if not self._persist:
             entry = self._memory["latest_totals"].get(serial_fmt)
             if entry and entry.get("day") == day_str:
                 return entry.get("total_wh")
             return None
-        cur = self._conn.execute(
-            "SELECT day, total_wh FROM latest_totals WHERE serial = ?",
-            (serial_fmt,),
-        )
-        row = cur.fetchone()
-        if row and row["day"] == day_str:
-            return row["total_wh"]
-        return None
+        cached = self._latest_cache.get(serial_fmt)
+        if cached is None:
+            row = self._conn.execute(_SQL_GET_LATEST_TOTAL, (serial_fmt,)).fetchone()
+            cached = (row["day"], row["total_wh"]) if row else (None, None)
+            self._latest_cache[serial_fmt] = cached
+        stored_day, total_wh = cached
+        return total_wh if stored_day == day_str else None
 
     # Summary baselines ----------------------------------------------
     def get_summary_baseline(self, serial: str) -> tuple[Optional[str], Optional[float]]:
         if not serial:
             return None, None
-        serial_fmt = serial.upper()
+        serial_fmt = _serial_key(serial)
         if not self._persist:
             entry = self._memory["summary_totals"].get(serial_fmt)
             if not entry:
                 return None, None
             return entry.get("day"), entry.get("total_wh")
-        cur = self._conn.execute(
-            "SELECT day, total_wh FROM summary_totals WHERE serial = ?",
-            (serial_fmt,),
-        )
+        cur = self._conn.execute(_SQL_GET_SUMMARY_BASELINE, (serial_fmt,))
         row = cur.fetchone()
         if not row:
             return None, None
@@ -316,20 +442,13 @@ class AppState:
     def set_summary_baseline(self, serial: str, day, total_wh: float) -> None:
         if serial is None or total_wh is None:
             return
-        serial_fmt = serial.upper()
+        serial_fmt = _serial_key(serial)
         day_str = _day_str(day)
         if not self._persist:
             self._memory["summary_totals"][serial_fmt] = {"day": day_str, "total_wh": total_wh}
             return
-        self._conn.execute(
-            """
-            INSERT INTO summary_totals(serial, day, total_wh)
-            VALUES (?, ?, ?)
-            ON CONFLICT(serial) DO UPDATE SET day=excluded.day, total_wh=excluded.total_wh
-            """,
-            (serial_fmt, day_str, total_wh),
-        )
-        self._conn.commit()
+        self._conn.execute(_SQL_SET_SUMMARY_BASELINE, (serial_fmt, day_str, total_wh))
+        self._maybe_commit()
 
     # ------------------------------------------------------------------
     def log_health_run(
@@ -345,60 +464,63 @@ class AppState:
             return
         run_ts = run_timestamp.isoformat()
         per_inverter = health.per_inverter if health else {}
-        with self._conn:
-            for name, snapshot in snapshots.items():
-                inv_health = per_inverter.get(name)
-                healthy = inv_health.inverter_ok if inv_health else False
-                reason = inv_health.reason if inv_health else None
-                serial = snapshot.serial if snapshot else None
-                status = snapshot.status if snapshot else None
-                pac_w = snapshot.pac_w if snapshot else None
-                vdc_v = snapshot.vdc_v if snapshot else None
-                idc_a = snapshot.idc_a if snapshot else None
-                total_wh = snapshot.total_wh if snapshot else None
-                cloud = None
-                if serial:
-                    key = serial.upper()
-                    cloud = cloud_by_serial.get(serial) or cloud_by_serial.get(key)
-                optimizer_count = None
-                if optimizer_counts and serial:
-                    optimizer_count = optimizer_counts.get(serial)
-                if optimizer_count is None and optimizer_counts and serial:
-                    optimizer_count = optimizer_counts.get(serial.upper())
-                if optimizer_count is None and cloud is not None:
-                    optimizer_count = getattr(cloud, "connected_optimizers", None)
-                self._conn.execute(
-                    """
-                    INSERT INTO inverter_snapshots (
-                        run_timestamp,
-                        inverter_name,
-                        serial,
-                        status,
-                        pac_w,
-                        vdc_v,
-                        idc_a,
-                        total_wh,
-                        optimizer_count,
-                        daylight_phase,
-                        healthy,
-                        health_reason
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        run_ts,
-                        name,
-                        serial,
-                        status,
-                        pac_w,
-                        vdc_v,
-                        idc_a,
-                        total_wh,
-                        optimizer_count,
-                        daylight_phase,
-                        1 if healthy else 0,
-                        reason,
-                    ),
+        rows = []
+        for name, snapshot in snapshots.items():
+            inv_health = per_inverter.get(name)
+            healthy = inv_health.inverter_ok if inv_health else False
+            reason = inv_health.reason if inv_health else None
+            serial = snapshot.serial if snapshot else None
+            status = snapshot.status if snapshot else None
+            pac_w = snapshot.pac_w if snapshot else None
+            vdc_v = snapshot.vdc_v if snapshot else None
+            idc_a = snapshot.idc_a if snapshot else None
+            total_wh = snapshot.total_wh if snapshot else None
+            cloud = None
+            optimizer_count = None
+            if serial:
+                # Cloud inventory and optimizer counts are keyed by upper-cased serial.
+                key = _serial_key(serial)
+                cloud = cloud_by_serial.get(key)
+                if optimizer_counts:
+                    optimizer_count = optimizer_counts.get(key)
+            if optimizer_count is None and cloud is not None:
+                optimizer_count = getattr(cloud, "connected_optimizers", None)
+            rows.append(
+                (
+                    run_ts,
+                    name,
+                    serial,
+                    status,
+                    pac_w,
+                    vdc_v,
+                    idc_a,
+                    total_wh,
+                    optimizer_count,
+                    daylight_phase,
+                    1 if healthy else 0,
+                    reason,
                 )
+            )
+        with self.transaction():
+            self._conn.executemany(
+                """
+                INSERT INTO inverter_snapshots (
+                    run_timestamp,
+                    inverter_name,
+                    serial,
+                    status,
+                    pac_w,
+                    vdc_v,
+                    idc_a,
+                    total_wh,
+                    optimizer_count,
+                    daylight_phase,
+                    healthy,
+                    health_reason
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
 
     def record_site_summary(self, day, site_wh_modbus: Optional[float], site_wh_api: Optional[float]) -> None:
         if not self._persist:
@@ -416,21 +538,18 @@ class AppState:
             """,
             (day_key, recorded_at, site_wh_modbus, site_wh_api),
         )
-        self._conn.commit()
+        self._maybe_commit()
 
     def has_site_summary(self, day) -> bool:
         day_key = _day_str(day)
         if not self._persist:
             return False
-        row = self._conn.execute(
-            "SELECT 1 FROM site_summaries WHERE day = ? LIMIT 1",
-            (day_key,),
-        ).fetchone()
+        row = self._conn.execute(_SQL_HAS_SITE_SUMMARY, (day_key,)).fetchone()
         return row is not None
 
     def get_health_counters(self) -> dict[str, tuple[int, int]]:
         if not self._persist:
-            counters = self._memory.get("health_counters", {})
+            counters = self._memory["health_counters"]
             out: dict[str, tuple[int, int]] = {}
             for name, values in counters.items():
                 if not isinstance(values, dict):
@@ -457,7 +576,7 @@ class AppState:
         updated_at: Optional[str] = None,
     ) -> None:
         if not self._persist:
-            mem = self._memory.setdefault("health_counters", {})
+            mem = self._memory["health_counters"]
             for name, values in counters.items():
                 failure_streak, recovery_streak = values
                 mem[str(name)] = {
@@ -488,7 +607,7 @@ class AppState:
 
     def get_open_incidents(self) -> dict[str, dict]:
         if not self._persist:
-            raw = self._memory.get("open_incidents", {})
+            raw = self._memory["open_incidents"]
             return {
                 str(k): dict(v)
                 for k, v in raw.items()
@@ -538,7 +657,7 @@ class AppState:
         payload: Optional[dict] = None,
     ) -> None:
         if not self._persist:
-            mem = self._memory.setdefault("open_incidents", {})
+            mem = self._memory["open_incidents"]
             mem[incident_key] = {
                 "fingerprint": fingerprint,
                 "serial": serial,
@@ -552,10 +671,7 @@ class AppState:
                 "source": source,
             }
             return
-        row = self._conn.execute(
-            "SELECT id FROM incidents WHERE incident_key = ? AND status = 'open'",
-            (incident_key,),
-        ).fetchone()
+        row = self._conn.execute(_SQL_OPEN_INCIDENT_ID, (incident_key,)).fetchone()
         if row:
             incident_id = int(row["id"])
             self._conn.execute(
@@ -610,16 +726,13 @@ class AppState:
             )
             incident_id = int(cur.lastrowid)
         self._conn.execute(
-            """
-            INSERT INTO incident_events(incident_id, event_type, event_ts, message, payload_json)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            _SQL_ADD_INCIDENT_EVENT,
             (
                 incident_id,
                 event_type,
                 event_ts,
                 message,
-                json.dumps(payload) if payload is not None else None,
+                _dumps(payload) if payload is not None else None,
             ),
         )
         self._maybe_commit()
@@ -634,13 +747,10 @@ class AppState:
         payload: Optional[dict] = None,
     ) -> None:
         if not self._persist:
-            mem = self._memory.setdefault("open_incidents", {})
+            mem = self._memory["open_incidents"]
             mem.pop(incident_key, None)
             return
-        row = self._conn.execute(
-            "SELECT id FROM incidents WHERE incident_key = ? AND status = 'open'",
-            (incident_key,),
-        ).fetchone()
+        row = self._conn.execute(_SQL_OPEN_INCIDENT_ID, (incident_key,)).fetchone()
         if not row:
             return
         incident_id = int(row["id"])
@@ -653,16 +763,13 @@ class AppState:
             (resolved_at, recovery_message, resolved_at, incident_id),
         )
         self._conn.execute(
-            """
-            INSERT INTO incident_events(incident_id, event_type, event_ts, message, payload_json)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            _SQL_ADD_INCIDENT_EVENT,
             (
                 incident_id,
                 event_type,
                 resolved_at,
                 recovery_message,
-                json.dumps(payload) if payload is not None else None,
+                _dumps(payload) if payload is not None else None,
             ),
         )
         self._maybe_commit()
@@ -27,7 +27,7 @@ class DailySummaryService:
         log,
         state: Optional[AppState] = None,
     ):
-        self.inverters = list(inverter_cfgs)
+        self.inverters = tuple(inverter_cfgs)
         self.api = api_client
         self.log = log
         self.state = state or AppState()
@@ -62,13 +62,21 @@ class DailySummaryService:
             site_wh_api = None
 
         per_inverter = []
+        # State writes are collected here and applied in one transaction after the
+        # loop, so no write lock is held across the per-inverter API calls.
+        serial_updates: Dict[str, str] = {}
+        total_updates: Dict[str, float] = {}
         modbus_map = modbus_snapshots or {}
         modbus_total = 0.0
         modbus_values_present = False
+        # Reversed so the first inventory entry per name wins, as the old linear scan did.
+        cloud_serials = {
+            cloud.name: cloud.serial.upper() for cloud in reversed(inventory) if cloud.serial
+        }
 
         for inv_cfg in self.inverters:
             name = inv_cfg.name
-            serial = self._resolve_serial(inv_cfg, inventory)
+            serial = cloud_serials.get(name) or self.state.get_inverter_serial(name)
 
             snapshot = modbus_map.get(name)
             current_total = None
@@ -79,7 +87,7 @@ class DailySummaryService:
                 current_total = self.state.get_latest_total(serial, day)
 
             if serial:
-                self.state.update_inverter_serial(name, serial)
+                serial_updates[name] = serial
             serial_norm = serial.upper() if serial else None
 
             api_energy = (
@@ -111,8 +119,7 @@ class DailySummaryService:
                 modbus_values_present = True
 
             if serial_norm and current_total is not None:
-                self.state.update_latest_total(serial_norm, day, current_total)
-                self.state.set_summary_baseline(serial_norm, day, current_total)
+                total_updates[serial_norm] = current_total
 
         site_wh_modbus = modbus_total if modbus_values_present else None
         summary = SummaryResult(
@@ -122,20 +129,17 @@ class DailySummaryService:
             per_inverter_wh=per_inverter,
         )
 
-        self.state.record_site_summary(day, site_wh_modbus, site_wh_api)
+        with self.state.transaction():
+            self.state.update_inverter_serials(serial_updates)
+            self.state.update_latest_totals(day, total_updates)
+            for serial_norm, current_total in total_updates.items():
+                self.state.set_summary_baseline(serial_norm, day, current_total)
+            self.state.record_site_summary(day, site_wh_modbus, site_wh_api)
 
         self.mark_ran(day)
         self.state.flush()
         return summary
 
-    # ------------------------------------------------------------------
-    def _resolve_serial(self, inv_cfg: InverterConfig, inventory: list[CloudInverter]) -> Optional[str]:
-        for cloud in inventory:
-            if cloud.name == inv_cfg.name:
-                if cloud.serial:
-                    return cloud.serial.upper()
-        return self.state.get_inverter_serial(inv_cfg.name)
-
     # ------------------------------------------------------------------
     def format_summary(self, summary: SummaryResult) -> str:
         lines = [f"Daily production for {summary.day.isoformat()}:"]
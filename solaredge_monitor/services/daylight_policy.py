@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
 try:
@@ -13,6 +13,8 @@ except ImportError:  # pragma: no cover - optional dependency
 from solaredge_monitor.config import DaylightConfig
 from solaredge_monitor.models.daylight import DaylightInfo
 
+_GRACE_PHASES = frozenset({"SUNRISE_GRACE", "SUNSET_GRACE"})
+
 
 class DaylightPolicy:
     """Encapsulates sunrise/sunset logic with configurable grace windows."""
@@ -37,6 +39,8 @@ class DaylightPolicy:
 
         self._static_sunrise = self._parse_time(cfg.static_sunrise) or time(6, 0)
         self._static_sunset = self._parse_time(cfg.static_sunset) or time(18, 0)
+        # Local date -> day boundaries; only the position of `now` within them varies.
+        self._windows: dict[date, tuple[datetime, ...]] = {}
 
     @staticmethod
     def _parse_time(raw: str | None) -> time | None:
@@ -64,6 +68,32 @@ class DaylightPolicy:
 
         return sunrise, sunset
 
+    def _day_windows(self, local_date: date) -> tuple[datetime, ...]:
+        """Sunrise, grace boundaries, sunset and production-over time for one date."""
+        windows = self._windows.get(local_date)
+        if windows is not None:
+            return windows
+        sunrise, sunset = self._sun_times(local_date)
+
+        sunrise_grace_end = sunrise + timedelta(minutes=self.cfg.sunrise_grace_minutes)
+        sunset_grace_start = sunset - timedelta(minutes=self.cfg.sunset_grace_minutes)
+        if sunset_grace_start < sunrise_grace_end:
+            sunset_grace_start = sunrise_grace_end
+
+        production_over_at = sunset + timedelta(minutes=self.cfg.summary_delay_minutes)
+
+        if len(self._windows) >= 32:
+            # Date sweeps (simulations) should not grow this without bound.
+            self._windows.clear()
+        windows = self._windows[local_date] = (
+            sunrise,
+            sunrise_grace_end,
+            sunset_grace_start,
+            sunset,
+            production_over_at,
+        )
+        return windows
+
     @property
     def timezone(self) -> ZoneInfo:
         return self._tz
@@ -77,14 +107,13 @@ class DaylightPolicy:
             local_now = now.replace(tzinfo=self._tz)
         else:
             local_now = now.astimezone(self._tz)
-        sunrise, sunset = self._sun_times(local_now.date())
-
-        sunrise_grace_end = sunrise + timedelta(minutes=self.cfg.sunrise_grace_minutes)
-        sunset_grace_start = sunset - timedelta(minutes=self.cfg.sunset_grace_minutes)
-        if sunset_grace_start < sunrise_grace_end:
-            sunset_grace_start = sunrise_grace_end
-
-        production_over_at = sunset + timedelta(minutes=self.cfg.summary_delay_minutes)
+        (
+            sunrise,
+            sunrise_grace_end,
+            sunset_grace_start,
+            sunset,
+            production_over_at,
+        ) = self._day_windows(local_now.date())
 
         if local_now < sunrise:
             phase = "NIGHT"
@@ -97,8 +126,8 @@ class DaylightPolicy:
         else:
             phase = "NIGHT"
 
-        in_grace = phase in ("SUNRISE_GRACE", "SUNSET_GRACE")
-        is_daylight = phase in ("SUNRISE_GRACE", "DAY", "SUNSET_GRACE")
+        in_grace = phase in _GRACE_PHASES
+        is_daylight = phase != "NIGHT"
         skip_modbus = phase == "NIGHT" and self._skip_modbus_at_night
         skip_cloud = phase == "NIGHT" and self._skip_cloud_at_night
         production_day_over = local_now >= production_over_at
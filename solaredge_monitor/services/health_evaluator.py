@@ -9,6 +9,12 @@ from solaredge_monitor.models.system_health import InverterHealth, SystemHealth
 from solaredge_monitor.models.inverter import InverterSnapshot
 
 
+# Sleeping, Starting, Shutting Down: expected around dawn/dusk, abnormal otherwise.
+TRANSITIONAL_STATUSES = frozenset({2, 3, 6})
+# Fault codes that only reflect PAC levels and may be cleared by low-light logic.
+PAC_RELATED_FAULTS = frozenset({"low_pac", "peer_mismatch", "low_vdc"})
+
+
 @dataclass
 class Thresholds:
     low_pac_w: Dict[str, Optional[float]]
@@ -97,7 +103,7 @@ class HealthEvaluator:
         # ---------------------------------------
         # Abnormal statuses (ALWAYS unhealthy)
         # ---------------------------------------
-        if status in (2, 3, 6):   # Sleeping, Starting, Shutting Down
+        if status in TRANSITIONAL_STATUSES:
             if not (dark_irradiance or sun_angle_suppressed):
                 return InverterHealth(
                     name=name,
@@ -260,7 +266,7 @@ class HealthEvaluator:
         for inv_state in per_inverter.values():
             if inv_state.inverter_ok:
                 continue
-            if inv_state.fault_code in ("low_pac", "peer_mismatch", "low_vdc"):
+            if inv_state.fault_code in PAC_RELATED_FAULTS:
                 inv_state.inverter_ok = True
                 inv_state.reason = None
                 inv_state.fault_code = None
@@ -305,10 +311,10 @@ class HealthEvaluator:
         )
         abnormal_status_present = any(
             inv.reading
-            and inv.reading.status not in (4,)
+            and inv.reading.status != 4
             and not (
                 (dark_irradiance or sun_angle_suppressed)
-                and inv.reading.status in (2, 3, 6)
+                and inv.reading.status in TRANSITIONAL_STATUSES
             )
             for inv in per_inverter.values()
         )
@@ -461,22 +467,19 @@ class HealthEvaluator:
         serial_by_name: Dict[str, str],
         optimizer_counts_by_serial: Dict[str, Optional[int]],
     ) -> List[Tuple[str, int, Optional[int]]]:
-        expected_counts = {
-            cfg.name: cfg.expected_optimizers
-            for cfg in inverter_cfgs
-            if cfg.expected_optimizers is not None
-        }
-        if not expected_counts:
-            return []
-
+        # Single pass: collect expected and observed counts together.
+        expected_counts: Dict[str, int] = {}
         actual_counts: Dict[str, Optional[int]] = {}
         for cfg in inverter_cfgs:
             if cfg.expected_optimizers is None:
                 continue
+            expected_counts[cfg.name] = cfg.expected_optimizers
             serial = serial_by_name.get(cfg.name)
             actual_counts[cfg.name] = (
                 optimizer_counts_by_serial.get(serial) if serial else None
             )
+        if not expected_counts:
+            return []
 
         mismatches = self.compute_optimizer_mismatches(expected_counts, actual_counts)
 
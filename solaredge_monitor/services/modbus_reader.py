@@ -1,13 +1,43 @@
 # solaredge_monitor/services/modbus_reader.py
 
 from __future__ import annotations
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Optional, Any
 
-from solaredge_monitor.vendor.solaredge_modbus import Inverter as ModbusInverter
 from solaredge_monitor.models.inverter import InverterSnapshot
 
 
+# The vendored client pulls in pymodbus (and asyncio) at import time. Resolve it on
+# first use so commands that never poll Modbus do not pay for it.
+ModbusInverter = None
+
+
+def _inverter_class():
+    global ModbusInverter
+    if ModbusInverter is None:
+        from solaredge_monitor.vendor.solaredge_modbus import Inverter
+
+        ModbusInverter = Inverter
+    return ModbusInverter
+
+
+def _disable_nagle(client: Any) -> None:
+    """Best-effort TCP_NODELAY on the vendor client's socket.
+
+    Modbus/TCP is strictly request/response with tiny frames, so Nagle's algorithm
+    only adds delay (the Modbus implementation guide recommends disabling it).
+    """
+    sock = getattr(getattr(client, "client", None), "socket", None)
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError):
+        pass
+
+
 # ============================================================================
 # Scale helper
 # ============================================================================
@@ -25,6 +55,19 @@ def apply_scale(value: Any, scale: Any) -> Optional[float]:
 # Modbus Reader
 # ============================================================================
 
+# SunSpec registers needed for a snapshot, grouped into two contiguous blocks
+# (common model identity, then inverter model telemetry) so each block is one
+# read_holding_registers round trip instead of one request per key.
+_IDENTITY_KEYS = ("c_model", "c_serialnumber")
+_TELEMETRY_KEYS = (
+    "power_ac", "power_ac_scale",
+    "energy_total", "energy_total_scale",
+    "current_dc", "current_dc_scale",
+    "voltage_dc", "voltage_dc_scale",
+    "status",
+)
+
+
 class ModbusReader:
     """
     Clean and reliable single-inverter Modbus reader, built from the known
@@ -34,7 +77,7 @@ class ModbusReader:
     def __init__(self, modbus_cfg: Any, log: Any):
         """
         modbus_cfg: ModbusConfig
-            .inverters → list[InverterConfig]
+            .inverters → tuple[InverterConfig, ...]
             .retries
             .timeout
 
@@ -47,7 +90,7 @@ class ModbusReader:
 
     # ----------------------------------------------------------------------
 
-    def _safe_read(self, client: ModbusInverter, key: str) -> Optional[Any]:
+    def _safe_read(self, client: Any, key: str) -> Optional[Any]:
         """Read a single SunSpec key safely."""
         try:
             result = client.read(key)
@@ -58,6 +101,21 @@ class ModbusReader:
             self.log.debug(f"Modbus read error [{key}]: {e}")
             return None
 
+    def _read_block(self, client: Any, keys: tuple[str, ...]) -> Dict[str, Any]:
+        """Read several SunSpec keys with one block request, per-key on failure."""
+        values: Dict[str, Any] = {}
+        try:
+            registers = client.registers
+            # The vendor decoder walks the block forwards, so order by address.
+            batch = dict(sorted(((k, registers[k]) for k in keys), key=lambda kv: kv[1][0]))
+            values = client._read_all(batch, batch[keys[0]][2]) or {}
+        except Exception as e:
+            self.log.debug(f"Modbus block read error [{keys[0]}..]: {e}")
+        for key in keys:
+            if key not in values:
+                values[key] = self._safe_read(client, key)
+        return values
+
     # ----------------------------------------------------------------------
 
     def read_inverter(self, inv_cfg) -> Optional[InverterSnapshot]:
@@ -74,7 +132,7 @@ class ModbusReader:
         port = inv_cfg.port
         unit = inv_cfg.unit
 
-        client = ModbusInverter(
+        client = _inverter_class()(
             host=host,
             port=port,
             unit=unit,
@@ -86,25 +144,28 @@ class ModbusReader:
             if not client.connect():
                 self.log.warning(f"{name}: Modbus connect failed (inverter unreachable?)")
                 return None
+            _disable_nagle(client)
 
             # Identity
-            serial = self._safe_read(client, "c_serialnumber")
-            model  = self._safe_read(client, "c_model")
+            ident = self._read_block(client, _IDENTITY_KEYS)
+            serial = ident["c_serialnumber"]
+            model = ident["c_model"]
 
             # Telemetry
-            status = self._safe_read(client, "status")
+            tele = self._read_block(client, _TELEMETRY_KEYS)
+            status = tele["status"]
 
-            pac    = self._safe_read(client, "power_ac")
-            pac_s  = self._safe_read(client, "power_ac_scale")
+            pac    = tele["power_ac"]
+            pac_s  = tele["power_ac_scale"]
 
-            vdc    = self._safe_read(client, "voltage_dc")
-            vdc_s  = self._safe_read(client, "voltage_dc_scale")
+            vdc    = tele["voltage_dc"]
+            vdc_s  = tele["voltage_dc_scale"]
 
-            idc    = self._safe_read(client, "current_dc")
-            idc_s  = self._safe_read(client, "current_dc_scale")
+            idc    = tele["current_dc"]
+            idc_s  = tele["current_dc_scale"]
 
-            total    = self._safe_read(client, "energy_total")
-            total_s  = self._safe_read(client, "energy_total_scale")
+            total    = tele["energy_total"]
+            total_s  = tele["energy_total_scale"]
 
             now = datetime.now(timezone.utc)
             return InverterSnapshot(
@@ -130,15 +191,21 @@ class ModbusReader:
     # ----------------------------------------------------------------------
 
     def read_all(self) -> Dict[str, Optional[InverterSnapshot]]:
-        results = {}
+        inverters = list(self.modbus_cfg.inverters)
+        for inv_cfg in inverters:
+            self.log.debug(f"Modbus: reading inverter {inv_cfg.name}")
+
+        # Each inverter has its own host and client, so poll them side by side;
+        # total latency becomes the slowest inverter rather than the sum.
+        if len(inverters) > 1:
+            with ThreadPoolExecutor(max_workers=len(inverters)) as pool:
+                readings = list(pool.map(self.read_inverter, inverters))
+        else:
+            readings = [self.read_inverter(inv_cfg) for inv_cfg in inverters]
 
-        for inv_cfg in self.modbus_cfg.inverters:
+        results = {}
+        for inv_cfg, reading in zip(inverters, readings):
             name = inv_cfg.name
-
-            self.log.debug(f"Modbus: reading inverter {name}")
-
-            reading = self.read_inverter(inv_cfg)
-
             if reading:
                 results[name] = reading
             else:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import urllib.error
 import urllib.parse
-import urllib.request
 
 from solaredge_monitor.config import HealthchecksConfig
 
@@ -23,6 +22,9 @@ class HealthchecksNotifier:
         if not self._enabled:
             self.log.debug("[Healthchecks] Disabled; skipping ping %s", suffix)
             return False
+        # Deferred: urllib.request pulls in http.client and ssl, which runs that never
+        # ping (maintain-db, disabled notifiers) should not pay for.
+        from urllib import request as urllib_request
 
         url = f"{self._base_url}{suffix}" if suffix else self._base_url
 
@@ -34,7 +36,7 @@ class HealthchecksNotifier:
         full_url = urllib.parse.urlunparse(parsed)
 
         try:
-            urllib.request.urlopen(full_url, timeout=10)
+            urllib_request.urlopen(full_url, timeout=10)
             self.log.debug("[Healthchecks] Ping sent to %s", suffix or "/")
             return True
         except urllib.error.URLError as exc:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import urllib.error
 import urllib.parse
-import urllib.request
 from typing import Iterable, Optional
 
 from solaredge_monitor.config import PushoverConfig
@@ -28,6 +27,8 @@ class PushoverNotifier:
         if not self._enabled:
             self.log.debug("[Pushover] Disabled; skipping message: %s", title)
             return False
+        # Deferred: urllib.request pulls in http.client and ssl (see healthchecks.py).
+        from urllib import request as urllib_request
 
         data = urllib.parse.urlencode(
             {
@@ -39,10 +40,10 @@ class PushoverNotifier:
             }
         ).encode("utf-8")
 
-        req = urllib.request.Request(self.API_URL, data=data)
+        req = urllib_request.Request(self.API_URL, data=data)
 
         try:
-            urllib.request.urlopen(req, timeout=10)
+            urllib_request.urlopen(req, timeout=10)
             self.log.info("[Pushover] Sent notification: %s", title)
             return True
         except urllib.error.URLError as exc:
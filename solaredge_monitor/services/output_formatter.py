@@ -3,25 +3,32 @@
 from __future__ import annotations
 
 import json
-from typing import Iterable, Mapping, Optional, Tuple
+import sys
+from typing import Iterable, Mapping, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from solaredge_monitor.services.se_api_client import CloudInverter
 from solaredge_monitor.models.inverter import InverterSnapshot
 from solaredge_monitor.models.weather import WeatherEstimate
 
 SnapshotItem = Tuple[str, Optional[InverterSnapshot]]
+Snapshots = Union[Mapping[str, Optional[InverterSnapshot]], Iterable[SnapshotItem]]
+
+
+def _snapshot_items(snapshots: Snapshots) -> Iterable[SnapshotItem]:
+    # Callers usually hold the name -> snapshot map already; iterate it in place.
+    return snapshots.items() if isinstance(snapshots, Mapping) else snapshots
 
 
 def _cloud_record(serial: Optional[str], cloud_by_serial: Mapping[str, CloudInverter]) -> Optional[CloudInverter]:
     if not serial or not cloud_by_serial:
         return None
-    inv = cloud_by_serial.get(serial) or cloud_by_serial.get(serial.upper())
-    return inv
-
-
-def _cloud_status(serial: Optional[str], cloud_by_serial: Mapping[str, CloudInverter]) -> Optional[str]:
-    inv = _cloud_record(serial, cloud_by_serial)
-    return inv.status if inv else None
+    # cloud_by_serial is keyed by upper-cased serial.
+    return cloud_by_serial.get(serial.upper())
 
 
 def _weather_to_dict(weather: WeatherEstimate | None) -> Optional[dict]:
@@ -66,13 +73,13 @@ def _weather_to_dict(weather: WeatherEstimate | None) -> Optional[dict]:
 
 
 def emit_json(
-    snapshot_items: Iterable[SnapshotItem],
+    snapshots: Snapshots,
     cloud_by_serial: Mapping[str, CloudInverter],
     *,
     weather_estimate: WeatherEstimate | None = None,
 ) -> None:
     payload = []
-    for name, snapshot in snapshot_items:
+    for name, snapshot in _snapshot_items(snapshots):
         if snapshot is None:
             payload.append({"name": name, "error": "No Modbus data"})
             continue
@@ -97,6 +104,22 @@ def emit_json(
     weather_payload = _weather_to_dict(weather_estimate)
     if weather_payload is not None:
         result["weather"] = weather_payload
+    _write_json(result)
+
+
+def _write_json(result: dict) -> None:
+    # orjson (when installed) encodes straight to UTF-8 bytes for the stdout buffer.
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        try:
+            data = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+        else:
+            sys.stdout.flush()
+            buffer.write(data)
+            buffer.flush()
+            return
     print(json.dumps(result, indent=2))
 
 
@@ -134,36 +157,45 @@ def _format_weather_human(weather: WeatherEstimate, snapshot_items: Iterable[Sna
     return lines
 
 
+_HUMAN_LINE = (
+    "[{name}] PAC={pac:.0f}W  Vdc={vdc:.1f}V  Idc={idc:.1f}A  status={status}{cloud}{optimizers}"
+)
+
+
 def emit_human(
-    snapshot_items: Iterable[SnapshotItem],
+    snapshots: Snapshots,
     cloud_by_serial: Mapping[str, CloudInverter],
     *,
     weather_estimate: WeatherEstimate | None = None,
 ) -> None:
-    items = list(snapshot_items)
+    items = list(_snapshot_items(snapshots))
+    lines: list[str] = []
     if weather_estimate:
-        for line in _format_weather_human(weather_estimate, items):
-            print(line)
+        lines.extend(_format_weather_human(weather_estimate, items))
     for name, snapshot in items:
         if snapshot is None:
-            print(f"[{name}] OFFLINE: no Modbus data")
+            lines.append(f"[{name}] OFFLINE: no Modbus data")
             continue
         if snapshot.error:
-            print(f"[{name}] ERROR: {snapshot.error}")
+            lines.append(f"[{name}] ERROR: {snapshot.error}")
             continue
 
-        cloud_status = _cloud_status(snapshot.serial, cloud_by_serial)
-        cloud_txt = f" cloud={cloud_status}" if cloud_status is not None else ""
-
         cloud_rec = _cloud_record(snapshot.serial, cloud_by_serial)
-        optimizers_txt = (
-            f" optimizers={cloud_rec.connected_optimizers}"
-            if cloud_rec and cloud_rec.connected_optimizers is not None
-            else ""
+        cloud_status = cloud_rec.status if cloud_rec else None
+        optimizers = cloud_rec.connected_optimizers if cloud_rec else None
+
+        lines.append(
+            _HUMAN_LINE.format(
+                name=name,
+                pac=snapshot.pac_w or 0,
+                vdc=snapshot.vdc_v or 0,
+                idc=snapshot.idc_a or 0,
+                status=snapshot.status,
+                cloud=f" cloud={cloud_status}" if cloud_status is not None else "",
+                optimizers=f" optimizers={optimizers}" if optimizers is not None else "",
+            )
         )
 
-        print(
-            f"[{name}] PAC={snapshot.pac_w or 0:.0f}W  "
-            f"Vdc={snapshot.vdc_v or 0:.1f}V  Idc={snapshot.idc_a or 0:.1f}A  "
-            f"status={snapshot.status}{cloud_txt}{optimizers_txt}"
-        )
+    # One write for the whole report instead of a print() per line.
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
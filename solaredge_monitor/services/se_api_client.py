@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import random
+import threading
+import time
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, List, Optional
-
-import requests
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from solaredge_monitor.config import SolarEdgeAPIConfig
 
+if TYPE_CHECKING:
+    import requests
+
+    from solaredge_monitor.services.app_state import AppState
+
 
 @dataclass
 class CloudInverter:
@@ -23,12 +30,48 @@ class SolarEdgeAPIClient:
     """Minimal SolarEdge Monitoring API wrapper with resilient parsing."""
 
     API_BASE_DEFAULT = "https://monitoringapi.solaredge.com"
-
-    def __init__(self, cfg: SolarEdgeAPIConfig, log, session: Optional[requests.Session] = None):
+    CACHE_KEY_PREFIX = "se_api_cache:"
+    # Spread expiries so sites on the same cron schedule do not refetch in lockstep.
+    CACHE_TTL_JITTER = (0.85, 1.15)
+    # SolarEdge quotas: 300 requests per site per day, at most 3 concurrent.
+    DAILY_REQUEST_LIMIT = 300
+    RATE_BUCKET_KEY = "se_api_rate_bucket"
+    _concurrency = threading.BoundedSemaphore(3)
+
+    def __init__(
+        self,
+        cfg: SolarEdgeAPIConfig,
+        log,
+        session: Optional["requests.Session"] = None,
+        state: Optional["AppState"] = None,
+    ):
         self.cfg = cfg
         self.log = log
-        self.session = session or requests.Session()
+        self._session = session
+        # Optional response cache (kv store) so cron runs do not each spend API quota.
+        self.state = state
+        self._bucket: Optional[Dict[str, float]] = None
         self.base_url = (cfg.base_url or self.API_BASE_DEFAULT).rstrip("/")
+        # Inventory fetched during this run; health, optimizer and summary paths share it.
+        self._inventory: Optional[List[CloudInverter]] = None
+
+    @property
+    def session(self) -> "requests.Session":
+        if self._session is None:
+            self._session = self._pooled_session()
+        return self._session
+
+    @staticmethod
+    def _pooled_session() -> "requests.Session":
+        # Keep-alive pool matching SolarEdge's 3-concurrent-request limit, so the
+        # inventory/energy calls in one run share a TLS connection. Built on first
+        # request so runs that never reach the API do not import requests.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=3))
+        return session
 
     # ------------------------------------------------------------------
     @property
@@ -60,17 +103,73 @@ class SolarEdgeAPIClient:
                 variants.append(base_serial)
         return variants
 
-    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+    def _cache_key(self, path: str, params: Optional[Dict[str, Any]]) -> str:
+        # Hash rather than embed the request so the API key never lands in the state DB.
+        raw = repr((path, sorted((params or {}).items()), self.cfg.api_key))
+        return self.CACHE_KEY_PREFIX + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl_s: float = 0.0,
+    ) -> Optional[Any]:
         if not self.enabled:
             self.log.debug("SolarEdge API disabled; skipping %s", path)
             return None
+        if self.state is None or cache_ttl_s <= 0:
+            return self._request(path, params)
+
+        key = self._cache_key(path, params)
+        cached = self.state.get(key)
+        now = time.time()
+        if isinstance(cached, dict) and cached.get("expires_at", 0) > now:
+            self.log.debug("SolarEdge API %s served from cache", path)
+            return cached.get("payload")
+
+        data = self._request(path, params)
+        if data is not None:
+            ttl = cache_ttl_s * random.uniform(*self.CACHE_TTL_JITTER)
+            self.state.set(key, {"expires_at": now + ttl, "payload": data})
+        elif isinstance(cached, dict) and "payload" in cached:
+            # Stale-if-error: an expired answer beats none when the API is failing.
+            self.log.info("SolarEdge API %s unavailable; using cached response", path)
+            return cached["payload"]
+        return data
+
+    def _acquire_token(self) -> bool:
+        """Take one request from the daily token bucket (persisted in state when available)."""
+        now = time.time()
+        bucket = self._bucket
+        if bucket is None:
+            stored = self.state.get(self.RATE_BUCKET_KEY) if self.state is not None else None
+            if isinstance(stored, dict) and {"tokens", "updated"} <= stored.keys():
+                bucket = stored
+            else:
+                bucket = {"tokens": float(self.DAILY_REQUEST_LIMIT), "updated": now}
+        limit = self.DAILY_REQUEST_LIMIT
+        elapsed = max(0.0, now - bucket["updated"])
+        tokens = min(float(limit), bucket["tokens"] + elapsed * limit / 86400.0)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        self._bucket = {"tokens": tokens, "updated": now}
+        if self.state is not None:
+            self.state.set(self.RATE_BUCKET_KEY, self._bucket)
+        return allowed
+
+    def _request(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        if not self._acquire_token():
+            self.log.warning("SolarEdge API daily request budget exhausted; skipping %s", path)
+            return None
 
         query = dict(params or {})
         query["api_key"] = self.cfg.api_key
         url = self._build_url(path)
 
         try:
-            resp = self.session.get(url, params=query, timeout=self.cfg.timeout)
+            with self._concurrency:
+                resp = self.session.get(url, params=query, timeout=self.cfg.timeout)
         except Exception as exc:  # pragma: no cover - network errors
             self.log.warning("SolarEdge API request failed for %s: %s", path, exc)
             return None
@@ -97,7 +196,13 @@ class SolarEdgeAPIClient:
 
     # ------------------------------------------------------------------
     def fetch_inverters(self) -> List[CloudInverter]:
-        payload = self._get(f"/site/{self.cfg.site_id}/inventory")
+        if self._inventory is not None:
+            return self._inventory
+
+        payload = self._get(
+            f"/site/{self.cfg.site_id}/inventory",
+            cache_ttl_s=self.cfg.cache_ttl_minutes * 60,
+        )
         if not isinstance(payload, dict):
             return []
 
@@ -154,6 +259,7 @@ class SolarEdgeAPIClient:
                 )
             )
 
+        self._inventory = cloud_inverters
         return cloud_inverters
 
     # ------------------------------------------------------------------
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import datetime as dt
 
+# SQLite's auto_vacuum value for INCREMENTAL mode.
+_AUTO_VACUUM_INCREMENTAL = 2
+
 
 def _cutoff(days: int) -> str:
     now = dt.datetime.now(dt.timezone.utc)
@@ -17,6 +20,8 @@ def prune(
     incident_event_days: int | None = None,
     health_counter_days: int | None = None,
     vacuum: bool = True,
+    full_vacuum: bool = False,
+    vacuum_page_limit: int = 2000,
 ) -> None:
     if not getattr(state, "_persist", False) or not getattr(state, "_conn", None):
         return
@@ -30,7 +35,11 @@ def prune(
         health_counter_days if health_counter_days is not None else summary_days
     )
     conn = state._conn
-    with conn:
+    # Take the write lock up front so the deletes never have to upgrade a read lock
+    # while a health run is writing.
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+    try:
         conn.execute(
             "DELETE FROM inverter_snapshots WHERE run_timestamp < ?",
             (snap_cutoff,),
@@ -51,5 +60,18 @@ def prune(
             "DELETE FROM health_counters WHERE COALESCE(updated_at, '1970-01-01T00:00:00+00:00') < ?",
             (health_counter_cutoff,),
         )
-    if vacuum:
+    except Exception:
+        conn.rollback()
+        raise
+    conn.commit()
+    if not vacuum:
+        return
+    mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    if full_vacuum or mode != _AUTO_VACUUM_INCREMENTAL:
+        # A full rewrite also converts databases created before incremental mode.
         conn.execute("VACUUM")
+    else:
+        # Release at most vacuum_page_limit free pages. The pragma frees one page per
+        # step and reports no rows, so execute() would stop after the first page;
+        # executescript() steps it to completion.
+        conn.executescript(f"PRAGMA incremental_vacuum({int(vacuum_page_limit)});")
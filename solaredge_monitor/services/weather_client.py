@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 import math
 
-import requests
 from zoneinfo import ZoneInfo
 
+if TYPE_CHECKING:
+    import requests
+
 try:
     from astral import Observer
     from astral.sun import azimuth, elevation
@@ -139,9 +141,14 @@ class WeatherClient:
     log: Any
     session: Optional[requests.Session] = None
 
-    def __post_init__(self):
+    def _http(self) -> "requests.Session":
+        # requests is imported (and the session built) on the first actual fetch, so
+        # runs with weather disabled never load it.
         if self.session is None:
+            import requests
+
             self.session = requests.Session()
+        return self.session
 
     def _coords(self, fallback_lat: float | None, fallback_lon: float | None) -> tuple[float | None, float | None]:
         lat = self.cfg.latitude if self.cfg.latitude is not None else fallback_lat
@@ -190,7 +197,7 @@ class WeatherClient:
         }
 
         try:
-            resp = self.session.get(OPEN_METEO_URL, params=params, timeout=10.0)
+            resp = self._http().get(OPEN_METEO_URL, params=params, timeout=10.0)
             resp.raise_for_status()
             data = resp.json()
         except Exception as exc:  # pragma: no cover - network errors
@@ -56,7 +56,7 @@ def test_alert_manager_uses_health_alerts():
 def test_alert_manager_handles_optimizer_mismatches_without_health():
     mgr = AlertStateManager(log=SimpleNamespace(debug=lambda *args, **kwargs: None))
 
-    mismatches = [("INV-A", 10, 2)]
+    mismatches = [("INV-A", 10, 2), ("INV-B", 8, None)]
     alerts = _alerts(
         mgr,
         now=datetime.now(),
@@ -66,6 +66,10 @@ def test_alert_manager_handles_optimizer_mismatches_without_health():
 
     assert alerts
     assert "Optimizer count mismatch" in alerts[0].message
+    assert [(a.inverter_name, a.serial, a.fault_code, a.message) for a in alerts] == [
+        ("INV-A", "CLOUD", "optimizer_mismatch", "Optimizer count mismatch (expected 10, cloud=2)"),
+        ("INV-B", "CLOUD", "optimizer_mismatch", "Optimizer count mismatch (expected 8, cloud=unknown)"),
+    ]
 
 
 def test_optimizer_mismatch_emitted_alongside_health_fault():
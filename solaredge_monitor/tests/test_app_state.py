@@ -142,3 +142,163 @@ def test_health_counters_persist_across_reopen(tmp_path):
     counters = reopened.get_health_counters()
     assert counters["INV-A"] == (2, 0)
     assert counters["INV-B"] == (0, 3)
+
+
+def test_serial_and_total_updates_commit_once_per_transaction(tmp_path):
+    db_path = tmp_path / "state.db"
+    state = AppState(path=db_path)
+    observer = sqlite3.connect(db_path)
+
+    with state.transaction():
+        state.update_inverter_serial("INV-A", "abc-1")
+        state.update_latest_total("abc-1", date(2024, 6, 1), 1000.0)
+        # Nothing is visible to other connections until the batch commits.
+        assert observer.execute("SELECT COUNT(*) FROM inverter_serials").fetchone()[0] == 0
+
+    assert observer.execute("SELECT serial FROM inverter_serials").fetchone()[0] == "ABC-1"
+    assert state.get_latest_total("ABC-1", date(2024, 6, 1)) == 1000.0
+
+    # Outside a transaction each write still commits on its own.
+    state.update_inverter_serial("INV-B", "def-2")
+    assert observer.execute("SELECT COUNT(*) FROM inverter_serials").fetchone()[0] == 2
+    observer.close()
+
+
+def test_flush_runs_pragma_optimize_once(tmp_path):
+    state = AppState(path=tmp_path / "state.db")
+    statements: list[str] = []
+    state._conn.set_trace_callback(statements.append)
+
+    state.set("k", 1)
+    state.flush()
+    state.flush()
+
+    assert statements.count("PRAGMA optimize") == 1
+
+
+def test_update_inverter_serials_upserts_in_bulk(tmp_path):
+    for state in (AppState(path=tmp_path / "state.db"), AppState(persist=False)):
+        state.update_inverter_serial("INV-A", "old-1")
+        state.update_inverter_serials({"INV-A": "abc-1", "INV-B": "def-2", "": "skip"})
+
+        assert state.get_inverter_serial("INV-A") == "ABC-1"
+        assert state.get_inverter_serial("INV-B") == "DEF-2"
+        assert state.get_inverter_serial("") is None
+
+
+def test_update_latest_totals_skips_missing_values(tmp_path):
+    day = date(2024, 6, 1)
+    for state in (AppState(path=tmp_path / "state.db"), AppState(persist=False)):
+        state.update_latest_total("ABC-1", date(2024, 5, 31), 500.0)
+        state.update_latest_totals(day, {"abc-1": 1000.0, "def-2": None})
+
+        assert state.get_latest_total("ABC-1", day) == 1000.0
+        assert state.get_latest_total("DEF-2", day) is None
+
+
+def test_kv_and_summary_writes_join_enclosing_transaction(tmp_path):
+    db_path = tmp_path / "state.db"
+    observer = sqlite3.connect(db_path)
+    with AppState(path=db_path) as state:
+        with state.transaction():
+            state.set("k", {"v": 1})
+            state.set_summary_baseline("abc-1", date(2024, 6, 1), 10.0)
+            state.record_site_summary(date(2024, 6, 1), 10.0, None)
+            assert observer.execute("SELECT COUNT(*) FROM kv_store").fetchone()[0] == 0
+        assert observer.execute("SELECT COUNT(*) FROM site_summaries").fetchone()[0] == 1
+        state.set("k", {"v": 2})
+
+    assert state.get("k") == {"v": 2}
+    assert observer.execute("SELECT COUNT(*) FROM summary_totals").fetchone()[0] == 1
+    observer.close()
+
+
+def test_kv_values_are_stored_compactly(tmp_path):
+    state = AppState(path=tmp_path / "state.db")
+    state.set("k", {"a": [1, 2], "b": None})
+    raw = state._conn.execute("SELECT value FROM kv_store WHERE key = 'k'").fetchone()[0]
+    assert raw == '{"a":[1,2],"b":null}'
+    assert state.get("k") == {"a": [1, 2], "b": None}
+
+
+def test_health_run_log_nests_inside_outer_transaction(tmp_path):
+    db_path = tmp_path / "state.db"
+    state = AppState(path=db_path)
+    observer = sqlite3.connect(db_path)
+    statements: list[str] = []
+    state._conn.set_trace_callback(statements.append)
+
+    with state.transaction():
+        state.log_health_run(
+            run_timestamp=datetime.now(),
+            daylight_phase="DAY",
+            snapshots={"INV-A": _snapshot("INV-A"), "INV-B": _snapshot("INV-B"), "INV-C": None},
+            health=None,
+            cloud_by_serial={},
+        )
+        state.set("k", 1)
+        # The inner log must not commit the outer batch early.
+        assert observer.execute("SELECT COUNT(*) FROM inverter_snapshots").fetchone()[0] == 0
+
+    names = observer.execute("SELECT inverter_name FROM inverter_snapshots ORDER BY id").fetchall()
+    assert [row[0] for row in names] == ["INV-A", "INV-B", "INV-C"]
+    assert statements[0] == "BEGIN IMMEDIATE"
+    assert statements.count("COMMIT") == 1
+    observer.close()
+
+
+def test_serial_and_latest_total_lookups_are_cached(tmp_path):
+    state = AppState(path=tmp_path / "state.db")
+    state.update_inverter_serial("INV-A", "abc")
+    state.update_latest_total("ABC", date(2024, 6, 1), 1200.0)
+    statements: list[str] = []
+    state._conn.set_trace_callback(statements.append)
+
+    for _ in range(3):
+        assert state.get_inverter_serial("INV-A") == "ABC"
+        assert state.get_inverter_serial("INV-Z") is None
+        assert state.get_latest_total("abc", date(2024, 6, 1)) == 1200.0
+        assert state.get_latest_total("abc", date(2024, 6, 2)) is None
+    assert sum(stmt.startswith("SELECT") for stmt in statements) == 1
+
+    state.update_inverter_serials({"INV-A": "def"})
+    state.update_latest_totals(date(2024, 6, 2), {"ABC": 50.0})
+    assert state.get_inverter_serial("INV-A") == "DEF"
+    assert state.get_latest_total("ABC", date(2024, 6, 2)) == 50.0
+
+    try:
+        with state.transaction():
+            state.update_inverter_serial("INV-A", "ghi")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert state.get_inverter_serial("INV-A") == "DEF"
+
+
+def test_unchanged_values_are_not_rewritten(tmp_path):
+    state = AppState(path=tmp_path / "state.db")
+    state.set("health_counters", {"INV-A": [0, 3]})
+    state.update_inverter_serials({"INV-A": "abc"})
+    state.update_latest_totals(date(2024, 6, 1), {"ABC": 1200.0})
+    statements: list[str] = []
+    state._conn.set_trace_callback(statements.append)
+
+    state.set("health_counters", {"INV-A": [0, 3]})
+    state.update_inverter_serial("INV-A", "ABC")
+    state.update_inverter_serials({"INV-A": "abc"})
+    state.update_latest_total("abc", date(2024, 6, 1), 1200.0)
+    state.update_latest_totals(date(2024, 6, 1), {"ABC": 1200.0})
+    assert statements == []
+
+    state.set("health_counters", {"INV-A": [0, 4]})
+    state.update_latest_totals(date(2024, 6, 1), {"ABC": 1300.0})
+    assert sum(stmt.startswith("INSERT") for stmt in statements) == 2
+    assert state.get("health_counters") == {"INV-A": [0, 4]}
+
+
+def test_kv_values_round_trip_non_finite_floats(tmp_path):
+    state = AppState(path=tmp_path / "state.db")
+    state.set("baseline", {"total_wh": float("inf"), "day": "2024-06-01"})
+    assert state.get("baseline") == {"total_wh": float("inf"), "day": "2024-06-01"}
+    state._conn.execute("UPDATE kv_store SET value = '{not json' WHERE key = 'baseline'")
+    assert state.get("baseline", "fallback") == "fallback"
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import dataclasses
+
 import pytest
 
-from solaredge_monitor.cli import build_parser
-from solaredge_monitor.config import Config
+from solaredge_monitor.cli import build_parser, fast_health_args
+from solaredge_monitor.config import Config, _load_memoized
 
 
 def _write_config(tmp_path: Path, body: str) -> Path:
@@ -54,6 +56,8 @@ def test_cli_parser_maintain_db_flags():
     assert args.snapshot_days == 10
     assert args.summary_days == 20
     assert args.no_vacuum is True
+    assert args.full_vacuum is False
+    assert parser.parse_args(["maintain-db", "--full-vacuum"]).full_vacuum is True
 
 
 def test_config_requires_modbus_section(tmp_path: Path):
@@ -144,6 +148,8 @@ structured_path = ./structured.jsonl
     assert [inv.name for inv in cfg.modbus.inverters] == ["INV-A", "INV-B"]
     assert cfg.modbus.inverters[0].expected_optimizers == 12
     assert cfg.modbus.inverters[0].ac_capacity_kw == 4.2
+    assert cfg.modbus.expected_optimizer_counts == {"INV-A": 12}
+    assert cfg.modbus.has_optimizer_expectations is True
     assert cfg.health.consecutive_recovery_samples == 1
     assert cfg.health.identical_alert_gate_minutes == 60
     assert cfg.health.repeat_alert_interval_minutes == 720
@@ -165,7 +171,7 @@ structured_path = ./structured.jsonl
 
     assert cfg.logging.console_level == "DEBUG"
     assert cfg.logging.console_quiet is True
-    assert cfg.logging.debug_modules == ["pymodbus", "requests"]
+    assert cfg.logging.debug_modules == ("pymodbus", "requests")
     assert cfg.logging.structured_enabled is True
     assert cfg.logging.structured_path == "./structured.jsonl"
 
@@ -183,6 +189,12 @@ host = 1.1.1.1
 
 [pushover]
 enabled = false
+
+[healthchecks]
+enabled = on
+
+[retention]
+vacuum_after_prune = no
 """.strip(),
     )
 
@@ -190,6 +202,8 @@ enabled = false
 
     assert cfg.modbus.skip_modbus_at_night is False
     assert cfg.pushover.enabled is False
+    assert cfg.healthchecks.enabled is True
+    assert cfg.retention.vacuum_after_prune is False
 
 
 def test_config_rejects_invalid_boolean_values(tmp_path: Path):
@@ -207,3 +221,197 @@ host = 1.1.1.1
 
     with pytest.raises(ValueError, match="Invalid boolean value"):
         Config.load(str(path))
+
+
+def test_config_cache_reuses_parse_until_file_changes(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("SOLAREDGE_CONFIG_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = _write_config(
+        tmp_path,
+        """
+[modbus]
+inverters = INV-A
+
+[inverter:INV-A]
+host = 1.1.1.1
+""".strip(),
+    )
+
+    first = Config.load(str(path))
+    assert (tmp_path / "cache" / "solaredge-monitor" / "config.pkl").exists()
+
+    parsed = []
+    original_parse = Config._parse.__func__
+    monkeypatch.setattr(
+        Config,
+        "_parse",
+        classmethod(lambda cls, p: parsed.append(p) or original_parse(cls, p)),
+    )
+
+    _load_memoized.cache_clear()
+    assert Config.load(str(path)) == first
+    assert parsed == []
+
+    path.write_text(path.read_text(encoding="utf-8") + "\nport = 1503\n", encoding="utf-8")
+    updated = Config.load(str(path))
+
+    assert parsed == [str(path)]
+    assert updated.modbus.inverters[0].port == 1503
+
+
+def test_cli_parser_only_builds_selected_subcommand_arguments():
+    argv = ["--config", "notify-test", "maintain-db", "--no-vacuum"]
+    parser = build_parser(argv)
+
+    args = parser.parse_args(argv)
+
+    assert args.config == "notify-test"
+    assert args.command == "maintain-db"
+    assert args.no_vacuum is True
+    with pytest.raises(SystemExit):
+        parser.parse_args(["simulate", "--scenario", "sunset"])
+
+
+def test_config_values_are_not_interpolated(tmp_path: Path):
+    path = _write_config(
+        tmp_path,
+        """
+[modbus]
+inverters = INV-A
+
+[inverter:INV-A]
+host = 1.1.1.1
+
+[healthchecks]
+ping_url = https://hc.example/ping/abc%20def
+""".strip(),
+    )
+
+    cfg = Config.load(str(path))
+
+    assert cfg.healthchecks.ping_url == "https://hc.example/ping/abc%20def"
+
+
+def test_cli_parser_is_reused_for_the_same_subcommand():
+    assert build_parser() is build_parser()
+    assert build_parser(["health"]) is build_parser(["--quiet", "health"])
+    assert build_parser(["health"]) is not build_parser(["simulate"])
+
+
+def test_config_missing_file_raises(tmp_path: Path):
+    with pytest.raises(FileNotFoundError, match="Config file not found"):
+        Config.load(str(tmp_path / "missing.conf"))
+
+
+def test_config_blank_optional_floats_fall_back_to_none(tmp_path: Path):
+    path = _write_config(
+        tmp_path,
+        """
+[modbus]
+inverters = INV-A
+
+[inverter:INV-A]
+host = 1.1.1.1
+
+[weather]
+latitude =          # Optional override latitude
+array_kw_dc =
+tilt_deg = 25
+""".strip(),
+    )
+
+    cfg = Config.load(str(path))
+
+    assert cfg.weather.latitude is None
+    assert cfg.weather.array_kw_dc is None
+    assert cfg.weather.tilt_deg == 25.0
+
+
+def test_fast_health_args_matches_argparse_for_plain_health_runs():
+    argv = ["--config=site.conf", "--quiet", "--json", "health"]
+
+    fast = fast_health_args(argv)
+    full = build_parser(argv).parse_args(argv)
+
+    assert vars(fast) == vars(full)
+    assert fast_health_args(["--config", "site.conf", "--debug", "health"]).config == "site.conf"
+    assert fast_health_args(["--verbose", "health"]) is None
+    assert fast_health_args(["simulate", "--scenario", "x"]) is None
+    assert fast_health_args(["--config", "health"]) is None
+
+
+def test_config_load_reuses_instance_until_file_changes(tmp_path: Path):
+    path = _write_config(
+        tmp_path,
+        """
+[modbus]
+inverters = INV-A
+
+[inverter:INV-A]
+host = 1.1.1.1
+""".strip(),
+    )
+
+    first = Config.load(str(path))
+    assert Config.load(str(path)) is first
+
+    path.write_text(path.read_text(encoding="utf-8") + "\nunit = 3\n", encoding="utf-8")
+    updated = Config.load(str(path))
+
+    assert updated is not first
+    assert updated.modbus.inverters[0].unit == 3
+
+
+def test_example_config_loads():
+    example = Path(__file__).resolve().parents[2] / "solaredge_monitor.conf.example"
+
+    cfg = Config.load(str(example))
+
+    assert [inv.name for inv in cfg.modbus.inverters] == ["SE10000H", "SE7600H"]
+    assert cfg.modbus.inverters[0].expected_optimizers == 26
+    assert cfg.modbus.inverters[0].array_kw_dc is None
+    assert cfg.weather.array_kw_dc == 18.23
+
+
+def test_loaded_config_is_immutable(tmp_path: Path):
+    path = _write_config(
+        tmp_path,
+        """
+[modbus]
+inverters = INV-A
+
+[inverter:INV-A]
+host = 1.1.1.1
+""".strip(),
+    )
+
+    cfg = Config.load(str(path))
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.modbus.retries = 9
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        cfg.modbus.inverters[0].host = "2.2.2.2"
+    assert not hasattr(cfg.health, "__dict__")
+
+
+def test_config_skips_simulation_sections_with_blank_names(tmp_path: Path):
+    path = _write_config(
+        tmp_path,
+        """
+[modbus]
+inverters = INV-A
+
+[inverter:INV-A]
+host = 1.1.1.1
+
+[simulation:   ]
+inverter_pac_w = INV-A:0
+
+[simulation:  sunset  ]
+inverter_pac_w = INV-A:50
+""".strip(),
+    )
+
+    cfg = Config.load(str(path))
+
+    assert list(cfg.simulation.scenarios) == ["sunset"]
@@ -21,3 +21,17 @@ def test_retention_config(tmp_path):
     assert cfg.retention.snapshot_days == 15
     assert cfg.retention.summary_days == 45
     assert cfg.retention.vacuum_after_prune is False
+
+
+def test_retention_blank_values_use_defaults(tmp_path):
+    conf_path = tmp_path / "solar.conf"
+    conf_path.write_text(
+        CONF.replace("snapshot_days = 15", "snapshot_days =").replace(
+            "vacuum_after_prune = false\n", ""
+        )
+    )
+    cfg = Config.load(str(conf_path))
+    assert cfg.retention.snapshot_days == 30
+    assert cfg.retention.summary_days == 45
+    assert cfg.retention.incident_days == 180
+    assert cfg.retention.vacuum_after_prune is True
@@ -1,5 +1,6 @@
 # solaredge_monitor/tests/test_daylight_policy.py
 
+from dataclasses import replace
 from datetime import datetime, timezone
 
 from solaredge_monitor.config import DaylightConfig
@@ -22,8 +23,7 @@ def _policy(skip_modbus_at_night=True, skip_cloud_at_night=False, **overrides):
         sunset_grace_minutes=45,
         summary_delay_minutes=60,
     )
-    for key, value in overrides.items():
-        setattr(cfg, key, value)
+    cfg = replace(cfg, **overrides)
     return DaylightPolicy(
         cfg,
         LOG,
@@ -68,3 +68,19 @@ def test_sunset_grace_and_production_over():
     later = datetime(2024, 6, 1, 19, 0, tzinfo=timezone.utc)
     later_info = policy.get_info(later)
     assert later_info.production_day_over
+
+
+def test_sun_times_computed_once_per_local_date(monkeypatch):
+    policy = _policy()
+    calls = []
+    original = policy._sun_times
+    monkeypatch.setattr(policy, "_sun_times", lambda day: calls.append(day) or original(day))
+
+    phases = [
+        policy.get_info(datetime(2024, 6, 1, hour, 0, tzinfo=timezone.utc)).phase
+        for hour in (2, 6, 12, 18)
+    ]
+    policy.get_info(datetime(2024, 6, 2, 12, 0, tzinfo=timezone.utc))
+
+    assert phases == ["NIGHT", "SUNRISE_GRACE", "DAY", "NIGHT"]
+    assert [day.isoformat() for day in calls] == ["2024-06-01", "2024-06-02"]
@@ -2,8 +2,19 @@ import json
 import logging
 import os
 import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
 
-from solaredge_monitor.logging import ConsoleLog, RunLogEntry, StructuredLog
+import solaredge_monitor.logging as logging_module
+from solaredge_monitor.logging import (
+    ConsoleLog,
+    RunLogEntry,
+    StructuredLog,
+    _FAST_CONVERTERS,
+    _encode_entry,
+    _to_jsonable,
+)
 
 
 def test_structured_log_writes_json():
@@ -46,3 +57,86 @@ def test_console_log_quiet_skips_handlers():
         root.handlers.clear()
         root.handlers.extend(orig_handlers)
         root.setLevel(orig_level)
+
+
+def test_to_jsonable_handles_nested_dataclasses_and_scalars():
+    @dataclass
+    class Inner:
+        when: datetime
+        where: Path
+
+    @dataclass
+    class Outer:
+        items: tuple
+        inner: Inner
+
+    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    result = _to_jsonable({"outer": Outer(items=(1, "a", None), inner=Inner(ts, Path("/tmp/x")))})
+
+    assert result == {
+        "outer": {
+            "items": [1, "a", None],
+            "inner": {"when": ts.isoformat(), "where": "/tmp/x"},
+        }
+    }
+    # Repeat conversions go through the per-type serializer registered on first use.
+    assert Outer in _FAST_CONVERTERS
+    assert _to_jsonable(Inner(ts, Path("/tmp/y"))) == {"when": ts.isoformat(), "where": "/tmp/y"}
+
+
+def test_structured_log_appends_entries_through_one_handle(tmp_path):
+    log_path = tmp_path / "structured.jsonl"
+    log = StructuredLog(str(log_path), enabled=True)
+    entry = RunLogEntry(
+        timestamp="2024-01-01T00:00:00Z",
+        daylight_phase=None,
+        daylight_context=None,
+        inverter_snapshots=None,
+        weather_snapshot=None,
+        weather_expectations=None,
+        residuals=None,
+        health=None,
+        alerts=None,
+        cloud_inventory=None,
+        optimizer_counts=None,
+    )
+
+    log.write(entry)
+    handle = log._fh
+    log.write(entry)
+
+    assert log._fh is handle
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["timestamp"] for line in lines] == [entry.timestamp] * 2
+    log.close()
+    assert log._fh is None
+
+
+def test_encode_entry_matches_stdlib_fallback(monkeypatch):
+    @dataclass
+    class Reading:
+        when: datetime
+        where: Path
+
+    ts = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+    entry = RunLogEntry(
+        timestamp=ts.isoformat(),
+        daylight_phase="day",
+        daylight_context={"sunrise": ts, "skip_modbus": False},
+        inverter_snapshots={"INV1": Reading(ts, Path("/tmp/x"))},
+        weather_snapshot=None,
+        weather_expectations=None,
+        residuals={"INV1": {"ratio": 0.5}},
+        health=None,
+        alerts=[{"message": "low output"}],
+        cloud_inventory=None,
+        optimizer_counts={"SN1": 12},
+    )
+
+    fast = _encode_entry(entry)
+    monkeypatch.setattr(logging_module, "orjson", None)
+    slow = _encode_entry(entry)
+
+    assert fast.endswith(b"\n") and slow.endswith(b"\n")
+    assert json.loads(fast) == json.loads(slow)
+    assert json.loads(fast)["inverter_snapshots"]["INV1"] == {"when": ts.isoformat(), "where": "/tmp/x"}
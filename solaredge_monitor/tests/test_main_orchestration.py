@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
 from solaredge_monitor.models.inverter import InverterSnapshot
+from solaredge_monitor.models.weather import InverterExpectation, WeatherEstimate, WeatherSnapshot
 from solaredge_monitor.models.system_health import InverterHealth, SystemHealth
 from solaredge_monitor.services.alert_logic import Alert
 from solaredge_monitor.services.health_evaluator import Thresholds
@@ -53,13 +57,27 @@ class FakeState:
         self.latest_totals: list[tuple[str, object, float]] = []
         self.flush_called = False
         self.logged_run = None
+        self.transactions = 0
+
+    @contextmanager
+    def transaction(self):
+        self.transactions += 1
+        yield
 
     def update_inverter_serial(self, name, serial):
         self.serials[name] = serial
 
+    def update_inverter_serials(self, serial_by_name):
+        self.serials.update(serial_by_name)
+
     def update_latest_total(self, serial, day, total_wh):
         self.latest_totals.append((serial, day, total_wh))
 
+    def update_latest_totals(self, day, totals):
+        self.latest_totals.extend(
+            (serial, day, total_wh) for serial, total_wh in totals.items() if total_wh is not None
+        )
+
     def get_inverter_serial(self, name):
         return self.serials.get(name)
 
@@ -83,6 +101,8 @@ def _app_cfg(tmp_path, *, api_enabled: bool, skip_api_at_night: bool = False):
         modbus=SimpleNamespace(
             inverters=[inverter],
             skip_modbus_at_night=True,
+            expected_optimizer_counts={"INV-A": 12},
+            has_optimizer_expectations=True,
         ),
         pushover=SimpleNamespace(),
         healthchecks=SimpleNamespace(),
@@ -197,6 +217,113 @@ def test_main_simulate_night_skips_modbus_and_notifications(monkeypatch, tmp_pat
     assert state.flush_called is True
 
 
+def test_main_health_idle_night_skips_evaluation_and_alert_bookkeeping(monkeypatch, tmp_path):
+    cfg = _app_cfg(tmp_path, api_enabled=True, skip_api_at_night=True)
+    log = DummyLog()
+    state = FakeState(path=cfg.state.path, persist=True)
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("idle night run should not reach this call")
+
+    class FakeDaylightPolicy:
+        def __init__(self, *args, **kwargs):
+            self.timezone = timezone.utc
+
+        def get_info(self, now):
+            return SimpleNamespace(
+                skip_modbus=True,
+                skip_cloud=True,
+                phase="night",
+                sunrise=datetime(2024, 6, 2, 5, 30, tzinfo=timezone.utc),
+            )
+
+    monkeypatch.setattr(main_module, "Config", SimpleNamespace(load=lambda path: cfg))
+    monkeypatch.setattr(main_module, "ConsoleLog", lambda **kwargs: FakeConsoleLog(log))
+    monkeypatch.setattr(main_module, "StructuredLog", FakeStructuredLog)
+    monkeypatch.setattr(main_module, "AppState", lambda *args, **kwargs: state)
+    monkeypatch.setattr(main_module, "NotificationManager", lambda *args, **kwargs: SimpleNamespace(handle_alerts=unexpected))
+    monkeypatch.setattr(main_module, "HealthEvaluator", lambda *args, **kwargs: SimpleNamespace())
+    monkeypatch.setattr(main_module, "DaylightPolicy", FakeDaylightPolicy)
+    monkeypatch.setattr(main_module, "ModbusReader", lambda *args, **kwargs: SimpleNamespace(read_all=unexpected))
+    monkeypatch.setattr(main_module, "SolarEdgeAPIClient", lambda *args, **kwargs: SimpleNamespace(enabled=True))
+    monkeypatch.setattr(
+        main_module,
+        "DailySummaryService",
+        lambda *args, **kwargs: SimpleNamespace(should_run=lambda day, daylight_info: False),
+    )
+    monkeypatch.setattr(
+        main_module,
+        "AlertStateManager",
+        lambda *args, **kwargs: SimpleNamespace(build_notification_batch=unexpected),
+    )
+    monkeypatch.setattr(main_module, "WeatherClient", lambda *args, **kwargs: SimpleNamespace(enabled=False))
+    monkeypatch.setattr("sys.argv", ["prog", "--config", "x.conf", "--quiet", "health"])
+
+    main_module.main()
+
+    assert state.flush_called is True
+    assert any("nothing to poll" in msg for msg, _ in log.messages)
+
+
+def test_main_health_fetches_weather_off_the_main_thread(monkeypatch, tmp_path):
+    cfg = _app_cfg(tmp_path, api_enabled=False)
+    log = DummyLog()
+    state = FakeState(path=cfg.state.path, persist=True)
+    fetch_threads = []
+
+    class FakeWeatherClient:
+        enabled = True
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def fetch(self, now, inverter_cfgs, fallback_lat=None, fallback_lon=None):
+            fetch_threads.append(threading.get_ident())
+            return None
+
+    class FakeDaylightPolicy:
+        def __init__(self, *args, **kwargs):
+            self.timezone = timezone.utc
+
+        def get_info(self, now):
+            return SimpleNamespace(
+                skip_modbus=False,
+                skip_cloud=False,
+                in_grace_window=False,
+                production_day_over=False,
+                is_daylight=True,
+                phase="day",
+            )
+
+    monkeypatch.setattr(main_module, "Config", SimpleNamespace(load=lambda path: cfg))
+    monkeypatch.setattr(main_module, "ConsoleLog", lambda **kwargs: FakeConsoleLog(log))
+    monkeypatch.setattr(main_module, "StructuredLog", FakeStructuredLog)
+    monkeypatch.setattr(main_module, "AppState", lambda *args, **kwargs: state)
+    monkeypatch.setattr(main_module, "NotificationManager", lambda *args, **kwargs: SimpleNamespace(handle_alerts=lambda *a, **k: None))
+    monkeypatch.setattr(main_module, "HealthEvaluator", lambda *args, **kwargs: SimpleNamespace())
+    monkeypatch.setattr(main_module, "DaylightPolicy", FakeDaylightPolicy)
+    monkeypatch.setattr(main_module, "ModbusReader", lambda *args, **kwargs: SimpleNamespace(read_all=lambda: {}))
+    monkeypatch.setattr(main_module, "SolarEdgeAPIClient", lambda *args, **kwargs: SimpleNamespace(enabled=False))
+    monkeypatch.setattr(
+        main_module,
+        "DailySummaryService",
+        lambda *args, **kwargs: SimpleNamespace(should_run=lambda day, daylight_info: False),
+    )
+    monkeypatch.setattr(
+        main_module,
+        "AlertStateManager",
+        lambda *args, **kwargs: SimpleNamespace(build_notification_batch=lambda **kwargs: ([], [], False)),
+    )
+    monkeypatch.setattr(main_module, "WeatherClient", FakeWeatherClient)
+    monkeypatch.setattr("sys.argv", ["prog", "--config", "x.conf", "--quiet", "health"])
+
+    main_module.main()
+
+    assert len(fetch_threads) == 1
+    assert fetch_threads[0] != threading.get_ident()
+    assert state.flush_called is True
+
+
 def test_main_health_flow_reads_cloud_notifies_and_persists(monkeypatch, tmp_path):
     cfg = _app_cfg(tmp_path, api_enabled=True)
     log = DummyLog(debug_enabled=True)
@@ -335,6 +462,7 @@ def test_main_health_flow_reads_cloud_notifies_and_persists(monkeypatch, tmp_pat
     assert state.logged_run is not None
     assert state.logged_run["snapshots"] == {"INV-A": snapshot}
     assert state.serials["INV-A"] == "INV-A-SERIAL"
+    assert state.transactions == 1
     assert state.flush_called is True
     assert evaluator.optimizer_args is not None
     assert evaluator.optimizer_args[2] == {"INV-A": "INV-A-SERIAL"}
@@ -560,3 +688,89 @@ def test_main_health_flow_uses_cached_serials_for_optimizer_lookup_when_modbus_i
     assert evaluator.optimizer_args is not None
     assert evaluator.optimizer_args[2]["INV-A"] == "INV-A-SERIAL"
     assert evaluator.optimizer_args[3] == {"INV-A-SERIAL-CF": 12, "INV-A-SERIAL": 12}
+
+
+def test_weather_jsonl_appends_rows_for_inverters_with_power(tmp_path, monkeypatch):
+    ts = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+    snapshot = WeatherSnapshot(
+        timestamp=ts,
+        source_series_time=ts,
+        cloud_cover_pct=10.0,
+        temp_c=20.0,
+        wind_mps=1.0,
+        ghi_wm2=800.0,
+        dni_wm2=700.0,
+        diffuse_wm2=100.0,
+        weather_code=0,
+        sun_azimuth_deg=180.0,
+        sun_elevation_deg=60.0,
+        provider="test",
+        source_latitude=1.0,
+        source_longitude=2.0,
+    )
+    expectation = dict.fromkeys(InverterExpectation.__dataclass_fields__, 1.0)
+    estimate = WeatherEstimate(
+        snapshot=snapshot,
+        per_inverter={
+            name: InverterExpectation(**{**expectation, "name": name}) for name in ("INV-A", "INV-B")
+        },
+    )
+    snaps = {
+        "INV-A": InverterSnapshot(
+            name="INV-A", serial="S1", model="M", status=4, vendor_status=None,
+            pac_w=900.0, vdc_v=None, idc_a=None, total_wh=None, error=None, timestamp=ts,
+        ),
+        "INV-B": None,
+    }
+    target = tmp_path / "weather.jsonl"
+
+    for encoder in (main_module.orjson, None):
+        monkeypatch.setattr(main_module, "orjson", encoder)
+        main_module._log_weather_jsonl(str(target), ts, estimate, snaps, DummyLog())
+
+    lines = target.read_text(encoding="utf-8").splitlines()
+    # Both encoders write the same compact line.
+    assert lines[0] == lines[1]
+    assert ", " not in lines[0]
+    rows = [json.loads(line) for line in lines]
+    # INV-B has no live reading, so only INV-A is logged on each run.
+    assert [row["inverter"] for row in rows] == ["INV-A"] * 2
+    assert rows[0] == rows[1]
+    assert rows[0]["run_ts"] == ts.isoformat()
+    assert rows[0]["pac_w"] == 900.0
+
+    # Rotating the file makes the next write reopen the path.
+    target.rename(tmp_path / "weather.jsonl.1")
+    main_module._log_weather_jsonl(str(target), ts, estimate, snaps, DummyLog())
+    assert len(target.read_text(encoding="utf-8").splitlines()) == 1
+
+    night = tmp_path / "night" / "weather.jsonl"
+    main_module._log_weather_jsonl(str(night), ts, estimate, {"INV-A": None}, DummyLog())
+    assert not night.parent.exists()
+
+
+def test_build_residuals_skips_inverters_without_both_readings():
+    def snap(pac):
+        return SimpleNamespace(pac_w=pac)
+
+    def expect(kw):
+        return SimpleNamespace(expected_ac_kw=kw)
+
+    residuals = main_module._build_residuals(
+        {"A": snap(500.0), "B": snap(None), "C": snap(100.0), "D": None, "E": snap(10.0)},
+        {"A": expect(1.0), "B": expect(1.0), "C": expect(0.0), "D": expect(1.0)},
+    )
+    assert residuals == {
+        "A": {"pac_w": 500.0, "expected_ac_w": 1000.0, "residual_w": -500.0, "ratio": 0.5},
+    }
+
+
+def test_classify_cloud_covers_each_phase():
+    classify = main_module._classify_cloud
+    CloudPhase = main_module.CloudPhase
+    assert classify(True, False, True) is CloudPhase.FETCH_ALL
+    assert classify(True, False, False) is CloudPhase.FETCH_INVENTORY_ONLY
+    assert classify(True, True, True) is CloudPhase.SKIP_WITH_WARN
+    assert classify(True, True, False) is CloudPhase.SKIP_SILENT
+    assert classify(False, False, True) is CloudPhase.SKIP_SILENT
+    assert [phase.polls for phase in CloudPhase] == [True, True, False, False]
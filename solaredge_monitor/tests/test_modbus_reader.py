@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import socket
+import threading
 from types import SimpleNamespace
 
 from solaredge_monitor.services import modbus_reader
+from solaredge_monitor.vendor.solaredge_modbus import Inverter
 
 
 class DummyLog:
@@ -53,8 +56,12 @@ def test_read_inverter_returns_none_when_connect_fails(monkeypatch):
 
 
 def test_read_inverter_scales_values_and_defaults_identity(monkeypatch):
+    sockopts = []
+
     class FakeClient:
         def __init__(self, **kwargs):
+            fake_socket = SimpleNamespace(setsockopt=lambda *args: sockopts.append(args))
+            self.client = SimpleNamespace(socket=fake_socket)
             self.values = {
                 "c_serialnumber": {},
                 "c_model": {},
@@ -86,6 +93,7 @@ def test_read_inverter_scales_values_and_defaults_identity(monkeypatch):
 
     result = reader.read_inverter(SimpleNamespace(name="INV-A", host="h", port=1502, unit=1))
 
+    assert sockopts == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
     assert result.serial == "unknown"
     assert result.model == "unknown"
     assert result.status == 4
@@ -119,3 +127,111 @@ def test_read_all_marks_offline_inverters(monkeypatch):
     assert set(result.keys()) == {"INV-A", "INV-B"}
     assert result["INV-A"].name == "INV-A"
     assert result["INV-B"] is None
+
+
+def test_read_all_polls_inverters_concurrently_and_keeps_config_order(monkeypatch):
+    names = ["INV-A", "INV-B", "INV-C"]
+    reader = modbus_reader.ModbusReader(
+        SimpleNamespace(
+            inverters=[SimpleNamespace(name=name) for name in names],
+            retries=2,
+            timeout=1.5,
+        ),
+        DummyLog(),
+    )
+    # Every read waits for the others, so this only completes if they run in parallel.
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def fake_read(inv_cfg):
+        barrier.wait()
+        return SimpleNamespace(name=inv_cfg.name)
+
+    monkeypatch.setattr(reader, "read_inverter", fake_read)
+
+    result = reader.read_all()
+
+    assert list(result) == names
+
+
+def test_read_inverter_fetches_registers_in_two_block_reads(monkeypatch):
+    def text_registers(text, words=16):
+        raw = text.encode().ljust(words * 2, b"\x00")
+        return [int.from_bytes(raw[i:i + 2], "big") for i in range(0, len(raw), 2)]
+
+    image = {}
+    image.update(zip(range(0x9C54, 0x9C64), text_registers("SE10000H")))
+    image.update(zip(range(0x9C74, 0x9C84), text_registers("7E123456")))
+    image.update({
+        0x9C93: 2500, 0x9C94: 0,            # power_ac, scale
+        0x9C9D: 0, 0x9C9E: 4560, 0x9C9F: 0,  # energy_total (acc32), scale
+        0x9CA0: 123, 0x9CA1: 0xFFFE,        # current_dc, scale -2
+        0x9CA2: 4000, 0x9CA3: 0xFFFF,       # voltage_dc, scale -1
+        0x9CAB: 4,                          # status
+    })
+    requests_seen = []
+
+    class FakeModbusClient:
+        def connect(self):
+            return True
+
+        def close(self):
+            pass
+
+        def read_holding_registers(self, address, count, slave=None):
+            requests_seen.append((address, count))
+            return SimpleNamespace(registers=[image.get(address + i, 0) for i in range(count)])
+
+    def make_inverter(**kwargs):
+        inverter = Inverter(**kwargs)
+        inverter.client = FakeModbusClient()
+        return inverter
+
+    monkeypatch.setattr(modbus_reader, "ModbusInverter", make_inverter)
+    reader = modbus_reader.ModbusReader(
+        SimpleNamespace(inverters=[], retries=2, timeout=1.5),
+        DummyLog(),
+    )
+
+    result = reader.read_inverter(SimpleNamespace(name="INV-A", host="h", port=1502, unit=1))
+
+    assert len(requests_seen) == 2
+    assert result.model == "SE10000H"
+    assert result.serial == "7E123456"
+    assert result.status == 4
+    assert result.pac_w == 2500.0
+    assert result.total_wh == 4560.0
+    assert result.idc_a == 1.23
+    assert result.vdc_v == 400.0
+
+
+def test_read_inverter_disconnects_after_each_read(monkeypatch):
+    instances = []
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            self.open = False
+            instances.append(self)
+
+        def connect(self):
+            self.open = True
+            return True
+
+        def read(self, key):
+            return {key: 1}
+
+        def disconnect(self):
+            self.open = False
+
+    monkeypatch.setattr(modbus_reader, "ModbusInverter", FakeClient)
+    reader = modbus_reader.ModbusReader(
+        SimpleNamespace(inverters=[], retries=2, timeout=1.5),
+        DummyLog(),
+    )
+    inv_cfg = SimpleNamespace(name="INV-A", host="h", port=1502, unit=1)
+
+    assert reader.read_inverter(inv_cfg) is not None
+    assert reader.read_inverter(inv_cfg) is not None
+
+    # The inverter's Modbus TCP slot is released as soon as each read finishes.
+    assert len(instances) == 2
+    assert not any(client.open for client in instances)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from urllib.parse import parse_qs, urlparse
@@ -14,6 +15,7 @@ from solaredge_monitor.services.alert_state import RecoveryNotification
 from solaredge_monitor.services.notification_manager import NotificationManager
 from solaredge_monitor.services.notifiers.healthchecks import HealthchecksNotifier
 from solaredge_monitor.services.notifiers.pushover import PushoverNotifier
+from solaredge_monitor.services import output_formatter
 from solaredge_monitor.services.output_formatter import emit_human, emit_json
 from solaredge_monitor.services.se_api_client import CloudInverter
 
@@ -318,6 +320,19 @@ def test_emit_json_includes_weather_and_offline_record(capsys):
     assert '"expected_ac_kw": 2.8' in out
 
 
+def test_emit_json_stdlib_fallback_matches_fast_path(capsys, monkeypatch):
+    snapshot_map = {"INV-A": _snapshot("INV-A", pac_w=2800.0), "INV-B": None}
+
+    emit_json(snapshot_map, {}, weather_estimate=_weather())
+    fast = capsys.readouterr().out
+    monkeypatch.setattr(output_formatter, "orjson", None)
+    emit_json(snapshot_map, {}, weather_estimate=_weather())
+    fallback = capsys.readouterr().out
+
+    assert json.loads(fast) == json.loads(fallback)
+    assert fast.endswith("\n") and fallback.endswith("\n")
+
+
 def test_emit_human_prints_weather_cloud_and_error_lines(capsys):
     snapshot_items = [
         ("INV-A", _snapshot("INV-A", pac_w=2800.0)),
@@ -344,3 +359,32 @@ def test_emit_human_prints_weather_cloud_and_error_lines(capsys):
     assert "cloud=Online optimizers=12" in out
     assert "[INV-B] ERROR: read failed" in out
     assert "[INV-C] OFFLINE: no Modbus data" in out
+
+
+def test_emit_human_accepts_snapshot_mapping(capsys):
+    snapshot_map = {
+        "INV-A": _snapshot("INV-A", pac_w=2800.0),
+        "INV-B": _snapshot("INV-B", error="read failed"),
+        "INV-C": None,
+    }
+
+    emit_human(snapshot_map, {})
+    out = capsys.readouterr().out
+
+    assert "[INV-A] PAC=2800W" in out
+    assert "[INV-B] ERROR: read failed" in out
+    assert "[INV-C] OFFLINE: no Modbus data" in out
+    assert out.index("[INV-A]") < out.index("[INV-B]") < out.index("[INV-C]")
+
+
+def test_alert_str_is_one_compact_line():
+    alert = Alert(
+        inverter_name="INV-A",
+        serial="S1",
+        fault_code="low_pac",
+        message="PAC below threshold",
+        status=4,
+        pac_w=12.5,
+    )
+    assert str(alert) == "Alert [INV-A] serial=S1 status=4 pac=12.5 reason=PAC below threshold"
+    assert "fault_code='low_pac'" in repr(alert)
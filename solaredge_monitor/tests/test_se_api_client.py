@@ -1,8 +1,11 @@
 # solaredge_monitor/tests/test_se_api_client.py
 
+import time
+from dataclasses import replace
 from datetime import date
 
 from solaredge_monitor.config import SolarEdgeAPIConfig
+from solaredge_monitor.services.app_state import AppState
 from solaredge_monitor.services.se_api_client import CloudInverter, SolarEdgeAPIClient
 from solaredge_monitor.logging import ConsoleLog, get_logger
 
@@ -41,8 +44,7 @@ def _cfg(**overrides):
         base_url="https://api.test",
         timeout=5,
     )
-    for key, value in overrides.items():
-        setattr(cfg, key, value)
+    cfg = replace(cfg, **overrides)
     return cfg
 
 
@@ -55,6 +57,13 @@ def test_disabled_client_short_circuits():
     assert client.get_daily_production(date.today()) is None
 
 
+def test_default_session_pools_connections_for_api_host():
+    client = SolarEdgeAPIClient(_cfg(), LOG)
+
+    adapter = client.session.get_adapter("https://monitoringapi.solaredge.com/site/1/inventory")
+    assert adapter._pool_maxsize == 3
+
+
 def test_inventory_parsing_variants():
     inventory_payload = {
         "Inventory": {
@@ -85,6 +94,74 @@ def test_inventory_parsing_variants():
     assert invs[1].connected_optimizers == 3
 
 
+def test_inventory_is_fetched_once_per_client():
+    inventory_payload = {"inventory": {"inverters": [{"serialNumber": "AA111", "connectedOptimizers": 8}]}}
+    session = FakeSession({
+        "https://api.test/site/123/inventory": (200, inventory_payload)
+    })
+    client = SolarEdgeAPIClient(_cfg(), LOG, session=session)
+
+    first = client.fetch_inverters()
+    assert client.fetch_inverters() is first
+    assert client.get_optimizer_counts() == {"AA111": 8}
+    assert client.check_optimizer_expectations({"AA111": 8}) == []
+    assert len(session.calls) == 1
+
+
+def test_failed_inventory_fetch_is_not_cached():
+    session = FakeSession({
+        "https://api.test/site/123/inventory": (503, {})
+    })
+    client = SolarEdgeAPIClient(_cfg(), LOG, session=session)
+
+    assert client.fetch_inverters() == []
+    assert client.fetch_inverters() == []
+    assert len(session.calls) == 2
+
+
+def test_inventory_cache_is_shared_across_clients_and_used_when_stale_on_error():
+    url = "https://api.test/site/123/inventory"
+    inventory_payload = {"inventory": {"inverters": [{"serialNumber": "AA111", "connectedOptimizers": 8}]}}
+    session = FakeSession({url: (200, inventory_payload)})
+    state = AppState(persist=False)
+    cfg = _cfg(cache_ttl_minutes=30)
+
+    def fetch_serials():
+        client = SolarEdgeAPIClient(cfg, LOG, session=session, state=state)
+        return [inv.serial for inv in client.fetch_inverters()]
+
+    assert fetch_serials() == ["AA111"]
+    assert fetch_serials() == ["AA111"]
+    assert len(session.calls) == 1
+    (key,) = [k for k in state._memory["kv"] if k.startswith(SolarEdgeAPIClient.CACHE_KEY_PREFIX)]
+    assert "KEY" not in key
+    remaining = state._memory["kv"][key]["expires_at"] - time.time()
+    assert 30 * 60 * 0.84 < remaining <= 30 * 60 * 1.15
+
+    # Expire the entry and make the API fail: the stored payload is still served.
+    state._memory["kv"][key]["expires_at"] = 0
+    session.responses[url] = (429, {})
+    assert fetch_serials() == ["AA111"]
+    assert len(session.calls) == 2
+
+
+def test_requests_stop_when_daily_budget_is_exhausted():
+    url = "https://api.test/site/123/inventory"
+    session = FakeSession({url: (200, {"inventory": {"inverters": []}})})
+    state = AppState(persist=False)
+    state.set(SolarEdgeAPIClient.RATE_BUCKET_KEY, {"tokens": 1.0, "updated": time.time()})
+
+    client = SolarEdgeAPIClient(_cfg(), LOG, session=session, state=state)
+    client.fetch_inverters()
+    assert len(session.calls) == 1
+
+    # The spent budget is persisted, so the next run's client is throttled too.
+    client = SolarEdgeAPIClient(_cfg(), LOG, session=session, state=state)
+    assert client.fetch_inverters() == []
+    assert len(session.calls) == 1
+    assert state.get(SolarEdgeAPIClient.RATE_BUCKET_KEY)["tokens"] < 1.0
+
+
 def test_optimizer_counts_include_serial_base_variant():
     client = SolarEdgeAPIClient(_cfg(), LOG)
     cloud = [
@@ -1,3 +1,4 @@
+import sqlite3
 from datetime import datetime, timedelta, timezone
 
 from solaredge_monitor.services.app_state import AppState
@@ -143,3 +144,65 @@ def test_prune_incident_tables_and_counters(tmp_path):
         "SELECT inverter_name FROM health_counters"
     ).fetchall()
     assert [tuple(row) for row in counters] == [("INV-OPEN",)]
+
+
+def _fill_and_age_snapshots(state, rows=2000):
+    old_ts = (datetime.now(timezone.utc) - timedelta(days=40)).isoformat()
+    state._conn.executemany(
+        "INSERT INTO inverter_snapshots (run_timestamp, inverter_name, healthy, health_reason) VALUES (?, ?, 1, ?)",
+        [(old_ts, f"INV-{i}", "x" * 200) for i in range(rows)],
+    )
+    state._conn.commit()
+
+
+def test_prune_releases_free_pages_incrementally(tmp_path):
+    state = AppState(path=tmp_path / "state.db")
+    assert state._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    _fill_and_age_snapshots(state)
+
+    state_maintenance.prune(state, snapshot_days=30, summary_days=30, vacuum_page_limit=5)
+    freelist_after_first = state._conn.execute("PRAGMA freelist_count").fetchone()[0]
+    assert freelist_after_first > 0
+
+    state_maintenance.prune(state, snapshot_days=30, summary_days=30, vacuum_page_limit=5)
+    assert state._conn.execute("PRAGMA freelist_count").fetchone()[0] == freelist_after_first - 5
+
+
+def test_prune_converts_legacy_database_with_one_full_vacuum(tmp_path):
+    db_path = tmp_path / "state.db"
+    legacy = sqlite3.connect(db_path)
+    legacy.execute("CREATE TABLE legacy_marker (id INTEGER)")
+    legacy.commit()
+    legacy.close()
+
+    state = AppState(path=db_path)
+    assert state._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    _fill_and_age_snapshots(state)
+
+    state_maintenance.prune(state, snapshot_days=30, summary_days=30)
+
+    assert state._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert state._conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_prune_deletes_under_one_immediate_transaction(tmp_path):
+    state = AppState(path=tmp_path / "state.db")
+    assert state._conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    statements: list[str] = []
+    state._conn.set_trace_callback(statements.append)
+
+    state_maintenance.prune(state, snapshot_days=30, summary_days=30, vacuum=False)
+
+    assert statements[0] == "BEGIN IMMEDIATE"
+    assert statements.count("COMMIT") == 1
+    assert sum(stmt.startswith("DELETE") for stmt in statements) == 5
+    assert not state._conn.in_transaction
+
+
+def test_prune_uses_snapshot_timestamp_index(tmp_path):
+    state = AppState(path=tmp_path / "state.db")
+    plan = state._conn.execute(
+        "EXPLAIN QUERY PLAN DELETE FROM inverter_snapshots WHERE run_timestamp < ?",
+        ("2024-01-01",),
+    ).fetchall()
+    assert any("ix_inverter_snapshots_run_ts_inverter" in row[-1] for row in plan)